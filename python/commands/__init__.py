@@ -1,19 +1,19 @@
-"""
-KiCAD command implementations package
-"""
-
-from .project import ProjectCommands
-from .board import BoardCommands
-from .component import ComponentCommands
-from .routing import RoutingCommands
-from .design_rules import DesignRuleCommands
-from .export import ExportCommands
-
-__all__ = [
-    'ProjectCommands',
-    'BoardCommands',
-    'ComponentCommands',
-    'RoutingCommands',
-    'DesignRuleCommands',
-    'ExportCommands'
-]
+"""
+KiCAD command implementations package
+"""
+
+from .project import ProjectCommands
+from .board import BoardCommands
+from .component import ComponentCommands
+from .routing import RoutingCommands
+from .design_rules import DesignRuleCommands
+from .export import ExportCommands
+
+__all__ = [
+    'ProjectCommands',
+    'BoardCommands',
+    'ComponentCommands',
+    'RoutingCommands',
+    'DesignRuleCommands',
+    'ExportCommands'
+]
@@ -0,0 +1,41 @@
+"""
+Coordinate generation for component array placement
+"""
+
+import math
+import functools
+from typing import List, Tuple
+
+def grid_coords_nm(x0: float, y0: float, rows: int, cols: int,
+                   sx: float, sy: float, scale: int) -> Tuple[List[int], List[int]]:
+    """Return row-major x and y nm coordinates of a rows x cols grid"""
+    xs_row = [int((x0 + c * sx) * scale) for c in range(cols)]
+    ys_col = [int((y0 + r * sy) * scale) for r in range(rows)]
+    xs = xs_row * rows
+    ys = [y for y in ys_col for _ in range(cols)]
+    return xs, ys
+
+@functools.lru_cache(maxsize=64)
+def _unit_circle(count: int, a0: float, astep: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Return cosines and sines of count angles starting at a0 degrees"""
+    angles = [math.radians(a0 + i * astep) for i in range(count)]
+    return tuple(math.cos(a) for a in angles), tuple(math.sin(a) for a in angles)
+
+def circular_coords_nm(cx: float, cy: float, radius: float, count: int,
+                       a0: float, astep: float, scale: int) -> Tuple[List[int], List[int]]:
+    """Return x and y nm coordinates of count points on a circle, starting at a0 degrees"""
+    # The trig only depends on the angles, so repeated layouts reuse it
+    # whatever their center and radius
+    cosines, sines = _unit_circle(count, a0, astep)
+    xs = [int((cx + radius * c) * scale) for c in cosines]
+    ys = [int((cy + radius * s) * scale) for s in sines]
+    return xs, ys
+
+def distribute_even(values: List[int]) -> List[int]:
+    """Return len(values) evenly spaced nm coordinates from the min to the max of values"""
+    n = len(values)
+    if n < 2:
+        return list(values)
+    vmin = min(values)
+    span = max(values) - vmin
+    return [vmin + (span * i) // (n - 1) for i in range(n)]
@@ -75,3 +75,12 @@ class BoardCommands:
         """Get a 2D image of the PCB"""
         self.view_commands.board = self.board
         return self.view_commands.get_board_2d_view(params)
+    
+    def get_board_2d_views(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get several 2D images of the PCB in one call"""
+        self.view_commands.board = self.board
+        return self.view_commands.get_board_2d_views(params)
+    
+    def invalidate_view_cache(self) -> None:
+        """Discard cached 2D views after the board has been modified"""
+        self.view_commands.invalidate_render_cache()
@@ -8,6 +8,12 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger('kicad_interface')
 
+# Converters from user units to KiCAD internal units (nanometers)
+_UNIT_TO_NM = {
+    "mm": pcbnew.FromMM,
+    "inch": lambda value: pcbnew.FromMils(value * 1000)
+}
+
 class BoardSizeCommands:
     """Handles board size operations"""
 
@@ -37,9 +43,15 @@ class BoardSizeCommands:
                 }
 
             # Convert to internal units (nanometers)
-            scale = 1000000 if unit == "mm" else 25400000  # mm or inch to nm
-            width_nm = int(width * scale)
-            height_nm = int(height * scale)
+            to_nm = _UNIT_TO_NM.get(unit)
+            if to_nm is None:
+                return {
+                    "success": False,
+                    "message": "Invalid unit",
+                    "errorDetails": f"Unit must be one of: {', '.join(_UNIT_TO_NM)}"
+                }
+            width_nm = to_nm(width)
+            height_nm = to_nm(height)
 
             # Set board size
             board_box = self.board.GetBoardEdgesBoundingBox()
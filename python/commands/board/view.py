@@ -3,22 +3,170 @@ Board view command implementations for KiCAD interface
 """
 
 import os
+import re
+import json
+import tempfile
 import pcbnew
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Union
 from PIL import Image
 import io
 import base64
 
+# Rasterizers: libvips is preferred, cairosvg is the fallback
+try:
+    import pyvips
+except (ImportError, OSError):
+    # pyvips raises OSError when the libvips shared library is missing
+    pyvips = None
+
+try:
+    from cairosvg import svg2png
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
+except ImportError:
+    svg2png = None
+
 logger = logging.getLogger('kicad_interface')
 
+# Encoded board renders keyed by (file, mtime, layers, width, height, format, fast, viewport)
+_RENDER_CACHE: "OrderedDict[Tuple[Any, ...], Union[str, bytes]]" = OrderedDict()
+_RENDER_CACHE_SIZE = 16
+
+# Views at or below this many pixels are rendered in fast (no text) mode
+_THUMBNAIL_PIXELS = 256 * 256
+
+# KiCAD layer type constants to the names reported in board info
+_LAYER_TYPE_MAP = {
+    pcbnew.LT_SIGNAL: "signal",
+    pcbnew.LT_POWER: "power",
+    pcbnew.LT_MIXED: "mixed",
+    pcbnew.LT_JUMPER: "jumper",
+    pcbnew.LT_USER: "user"
+}
+
+# MIME types of the supported view formats
+_CONTENT_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "svg": "image/svg+xml"
+}
+
+# Plot into RAM-backed tmpfs where available; large boards produce SVGs
+# of tens of MB that never need to touch the disk
+_PLOT_TMP_ROOT: Optional[str] = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Root element of a plotted SVG and the attributes that size it
+_SVG_ROOT_RE = re.compile(rb'<svg\b[^>]*>')
+_SVG_VIEWBOX_RE = re.compile(rb'\sviewBox="([^"]*)"')
+_SVG_WIDTH_RE = re.compile(rb'\swidth="([\d.]+)(mm|cm|in|pt)"')
+_SVG_HEIGHT_RE = re.compile(rb'\sheight="([\d.]+)(mm|cm|in|pt)"')
+
+# Millimetres per SVG length unit; KiCAD's SVG plotter sizes the page in cm
+_SVG_UNIT_MM = {b"mm": 1.0, b"cm": 10.0, b"in": 25.4, b"pt": 25.4 / 72}
+
+def _cache_render(cache_key: Tuple[Any, ...], image_data: Union[str, bytes]) -> None:
+    """Store a render in the LRU cache, evicting the oldest entry if full"""
+    _RENDER_CACHE[cache_key] = image_data
+    if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+        _RENDER_CACHE.popitem(last=False)
+
+def _crop_svg(svg_bytes: bytes, viewport: Dict[str, Any]) -> bytes:
+    """Restrict an SVG plot to a board region given in mm
+
+    Rewrites the root viewBox so rasterizers only render the region.
+    """
+    root_match = _SVG_ROOT_RE.search(svg_bytes)
+    if root_match is None:
+        raise ValueError("Plot output has no <svg> element")
+    root = root_match.group(0)
+    view_box_match = _SVG_VIEWBOX_RE.search(root)
+    width_match = _SVG_WIDTH_RE.search(root)
+    if view_box_match is None or width_match is None:
+        raise ValueError("Plot output has no viewBox with an absolute width")
+
+    x, y, width, height = (float(viewport[key]) for key in ("x", "y", "width", "height"))
+    if width <= 0 or height <= 0:
+        raise ValueError("Viewport width and height must be positive")
+
+    # Plot coordinates are page coordinates, which KiCAD board coordinates share
+    view_box = [float(value) for value in view_box_match.group(1).replace(b',', b' ').split()]
+    units_per_mm = view_box[2] / (float(width_match.group(1)) * _SVG_UNIT_MM[width_match.group(2)])
+    cropped_box = (f' viewBox="{view_box[0] + x * units_per_mm:.10g} {view_box[1] + y * units_per_mm:.10g} '
+                   f'{width * units_per_mm:.10g} {height * units_per_mm:.10g}"')
+
+    root = _SVG_VIEWBOX_RE.sub(cropped_box.encode('ascii'), root, count=1)
+    root = _SVG_WIDTH_RE.sub(f' width="{width:g}mm"'.encode('ascii'), root, count=1)
+    root = _SVG_HEIGHT_RE.sub(f' height="{height:g}mm"'.encode('ascii'), root, count=1)
+    return svg_bytes[:root_match.start()] + root + svg_bytes[root_match.end():]
+
+def _svg_to_raster(svg_bytes: bytes, format: str, width: int, height: int) -> bytes:
+    """Rasterize SVG data to encoded PNG or JPG bytes"""
+    # Rasterize with libvips (librsvg), falling back to cairosvg
+    if pyvips is not None:
+        # Force the exact size, as cairosvg renders it, rather than fitting
+        # the plot inside the box
+        img = pyvips.Image.thumbnail_buffer(svg_bytes, width, height=height, size="force")
+        if format == "jpg":
+            # Encode straight from the vips pipeline, no PNG intermediate
+            return img.write_to_buffer('.jpg[Q=85,optimize_coding=true]')
+        return img.write_to_buffer('.png')
+
+    if svg2png is None:
+        raise RuntimeError("Neither pyvips nor cairosvg is installed")
+
+    # Pass the SVG as a bytestring, never as url=. cairosvg only fills its
+    # per-surface tree cache for documents that have a URL, and that cache
+    # is what balloons memory on plots with many <use> references to pads.
+    if format == "jpg":
+        # Encode JPG from the raw cairo pixels instead of compressing a PNG
+        # only to decode it again. ARGB32 surfaces are native-endian and
+        # premultiplied, i.e. BGRa byte order on little-endian hosts.
+        surface = PNGSurface(Tree(bytestring=svg_bytes), None, 96,
+                             output_width=width, output_height=height).cairo
+        surface.flush()
+        img = Image.frombuffer('RGBA', (surface.get_width(), surface.get_height()),
+                               bytes(surface.get_data()), 'raw', 'BGRa', surface.get_stride(), 1)
+        jpg_buffer = io.BytesIO()
+        img.convert('RGB').save(jpg_buffer, format='JPEG', quality=85)
+        return jpg_buffer.getvalue()
+
+    return svg2png(bytestring=svg_bytes, output_width=width, output_height=height)
+
 class BoardViewCommands:
     """Handles board viewing operations"""
 
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
+        self._board: Optional[pcbnew.BOARD] = None
+        self._board_file: Optional[str] = None
+        self._plotter: Optional[pcbnew.PLOT_CONTROLLER] = None
+        self._last_request_sig: Optional[Tuple[Any, ...]] = None
+        self._last_response: Optional[Dict[str, Any]] = None
         self.board = board
 
+    @property
+    def board(self) -> Optional[pcbnew.BOARD]:
+        """Board being viewed"""
+        return self._board
+
+    @board.setter
+    def board(self, board: Optional[pcbnew.BOARD]) -> None:
+        """Attach a board, dropping state cached for the previous one"""
+        if board is not self._board:
+            self._board = board
+            self._board_file = None
+            self._plotter = None
+            self._last_request_sig = None
+            self._last_response = None
+
+    def _get_board_file(self) -> str:
+        """Return the board file name, looked up once per attached board"""
+        if self._board_file is None:
+            self._board_file = self.board.GetFileName()
+        return self._board_file
+
     def get_board_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get information about the current board"""
         try:
@@ -39,14 +187,13 @@ class BoardViewCommands:
             height_mm = height_nm / 1000000
 
             # Get layer information
-            layers = []
-            for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                if self.board.IsLayerEnabled(layer_id):
-                    layers.append({
-                        "name": self.board.GetLayerName(layer_id),
-                        "type": self._get_layer_type_name(self.board.GetLayerType(layer_id)),
-                        "id": layer_id
-                    })
+            layers: List[Dict[str, Any]] = []
+            for layer_id in self.board.GetEnabledLayers().Seq():
+                layers.append({
+                    "name": self.board.GetLayerName(layer_id),
+                    "type": self._get_layer_type_name(self.board.GetLayerType(layer_id)),
+                    "id": layer_id
+                })
 
             return {
                 "success": True,
@@ -73,6 +220,27 @@ class BoardViewCommands:
 
     def get_board_2d_view(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get a 2D image of the PCB"""
+        # Identical back-to-back requests return the previous response as-is
+        request_sig = None
+        if self.board and not params.get("outputPath"):
+            filename = self._get_board_file()
+            mtime = os.path.getmtime(filename) if filename and os.path.exists(filename) else None
+            request_sig = (json.dumps(params, sort_keys=True), filename, mtime)
+            if request_sig == self._last_request_sig:
+                return self._last_response
+
+        result = self.get_board_2d_views({"views": [params]})
+        if not result["success"]:
+            return result
+        response = {"success": True, **result["views"][0]}
+
+        if request_sig is not None:
+            self._last_request_sig = request_sig
+            self._last_response = response
+        return response
+
+    def get_board_2d_views(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get several 2D images of the PCB from a single plot session"""
         try:
             if not self.board:
                 return {
@@ -81,75 +249,92 @@ class BoardViewCommands:
                     "errorDetails": "Load or create a board first"
                 }
 
-            # Get parameters
-            width = params.get("width", 800)
-            height = params.get("height", 600)
-            format = params.get("format", "png")
-            layers = params.get("layers", [])
-
-            # Create plot controller
-            plotter = pcbnew.PLOT_CONTROLLER(self.board)
-            
-            # Set up plot options
-            plot_opts = plotter.GetPlotOptions()
-            plot_opts.SetOutputDirectory(os.path.dirname(self.board.GetFileName()))
-            plot_opts.SetScale(1)
-            plot_opts.SetMirror(False)
-            plot_opts.SetExcludeEdgeLayer(False)
-            plot_opts.SetPlotFrameRef(False)
-            plot_opts.SetPlotValue(True)
-            plot_opts.SetPlotReference(True)
-            
-            # Plot to SVG first (for vector output)
-            temp_svg = os.path.join(os.path.dirname(self.board.GetFileName()), "temp_view.svg")
-            plotter.OpenPlotfile("temp_view", pcbnew.PLOT_FORMAT_SVG, "Temporary View")
-            
-            # Plot specified layers or all enabled layers
-            if layers:
-                for layer_name in layers:
-                    layer_id = self.board.GetLayerID(layer_name)
-                    if layer_id >= 0 and self.board.IsLayerEnabled(layer_id):
-                        plotter.PlotLayer(layer_id)
-            else:
-                for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                    if self.board.IsLayerEnabled(layer_id):
-                        plotter.PlotLayer(layer_id)
-            
-            plotter.ClosePlot()
-
-            # Convert SVG to requested format
-            if format == "svg":
-                with open(temp_svg, 'r') as f:
-                    svg_data = f.read()
-                os.remove(temp_svg)
+            views = params.get("views")
+            if not views:
                 return {
-                    "success": True,
-                    "imageData": svg_data,
-                    "format": "svg"
+                    "success": False,
+                    "message": "Missing views",
+                    "errorDetails": "views must contain at least one view definition"
+                }
+
+            # Renders are reused while the board file is unchanged
+            filename = self._get_board_file()
+            mtime = os.path.getmtime(filename) if filename and os.path.exists(filename) else None
+
+            images: List[Union[str, bytes, None]] = []
+            pending: List[Tuple[int, Tuple[Any, ...], bytes, str, int, int]] = []
+            plotter = None
+            enabled_layers: List[int] = []
+            # Plot into a private temporary directory so the SVGs never land
+            # next to the user's board and are cleaned up even on failure
+            with tempfile.TemporaryDirectory(dir=_PLOT_TMP_ROOT) as tmp_dir:
+                for index, view in enumerate(views):
+                    width = view.get("width", 800)
+                    height = view.get("height", 600)
+                    format = view.get("format", "png")
+                    layers = view.get("layers", [])
+                    viewport = view.get("viewport")
+                    # Text is unreadable in thumbnails, so small views skip it
+                    fast = view.get("quality") == "fast" or width * height <= _THUMBNAIL_PIXELS
+
+                    viewport_key = tuple(viewport.get(key) for key in ("x", "y", "width", "height")) if viewport else None
+                    cache_key = (filename, mtime, tuple(layers), width, height, format, fast, viewport_key)
+                    image_data = _RENDER_CACHE.get(cache_key)
+                    if image_data is not None:
+                        _RENDER_CACHE.move_to_end(cache_key)
+                    else:
+                        # Plotting uses pcbnew and has to stay on this thread
+                        if plotter is None:
+                            plotter = self._get_plotter(tmp_dir)
+                            enabled_layers = list(self.board.GetEnabledLayers().Seq())
+                        svg_bytes = self._plot_svg(plotter, f"view_{index}", layers, enabled_layers, fast)
+                        if viewport:
+                            svg_bytes = _crop_svg(svg_bytes, viewport)
+                        if format == "svg":
+                            image_data = svg_bytes.decode('utf-8')
+                            _cache_render(cache_key, image_data)
+                        else:
+                            pending.append((index, cache_key, svg_bytes, format, width, height))
+                    images.append(image_data)
+
+            # Rasterize the remaining views once every view has been plotted
+            for index, cache_key, svg_bytes, format, width, height in pending:
+                image_data = _svg_to_raster(svg_bytes, format, width, height)
+                _cache_render(cache_key, image_data)
+                images[index] = image_data
+
+            results: List[Dict[str, Any]] = []
+            for view, image_data in zip(views, images):
+                format = view.get("format", "png")
+                if format not in _CONTENT_TYPES:
+                    format = "png"
+                result: Dict[str, Any] = {
+                    "format": format,
+                    "contentType": _CONTENT_TYPES[format]
                 }
-            else:
-                # Use PIL to convert SVG to PNG/JPG
-                from cairosvg import svg2png
-                png_data = svg2png(url=temp_svg, output_width=width, output_height=height)
-                os.remove(temp_svg)
-                
-                if format == "jpg":
-                    # Convert PNG to JPG
-                    img = Image.open(io.BytesIO(png_data))
-                    jpg_buffer = io.BytesIO()
-                    img.convert('RGB').save(jpg_buffer, format='JPEG')
-                    jpg_data = jpg_buffer.getvalue()
-                    return {
-                        "success": True,
-                        "imageData": base64.b64encode(jpg_data).decode('utf-8'),
-                        "format": "jpg"
-                    }
+
+                # Writing to a file skips base64 encoding of the payload entirely
+                output_path = view.get("outputPath")
+                if output_path:
+                    output_path = os.path.abspath(os.path.expanduser(output_path))
+                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                    if format == "svg":
+                        with open(output_path, 'w', encoding='utf-8') as f:
+                            f.write(image_data)
+                    else:
+                        with open(output_path, 'wb') as f:
+                            f.write(image_data)
+                    result["path"] = output_path
+                elif format == "svg":
+                    result["imageData"] = image_data
                 else:
-                    return {
-                        "success": True,
-                        "imageData": base64.b64encode(png_data).decode('utf-8'),
-                        "format": "png"
-                    }
+                    result["imageData"] = base64.b64encode(image_data).decode('ascii')
+                results.append(result)
+
+            return {
+                "success": True,
+                "views": results
+            }
 
         except Exception as e:
             logger.error(f"Error getting board 2D view: {str(e)}")
@@ -158,14 +343,66 @@ class BoardViewCommands:
                 "message": "Failed to get board 2D view",
                 "errorDetails": str(e)
             }
-    
+
+    def invalidate_render_cache(self) -> None:
+        """Drop cached board renders after the board has been modified"""
+        _RENDER_CACHE.clear()
+        # A save can rename the board file without replacing the board
+        self._board_file = None
+        self._last_request_sig = None
+        self._last_response = None
+
+    def _get_plotter(self, output_dir: str) -> pcbnew.PLOT_CONTROLLER:
+        """Return the plot controller for this board, pointed at output_dir"""
+        # The controller and its default options are built once per board;
+        # only the output directory changes between requests
+        if self._plotter is None:
+            self._plotter = pcbnew.PLOT_CONTROLLER(self.board)
+
+            # Set up plot options
+            plot_opts = self._plotter.GetPlotOptions()
+            plot_opts.SetScale(1)
+            plot_opts.SetMirror(False)
+            plot_opts.SetExcludeEdgeLayer(False)
+            plot_opts.SetPlotFrameRef(False)
+            plot_opts.SetPlotValue(True)
+            plot_opts.SetPlotReference(True)
+
+        self._plotter.GetPlotOptions().SetOutputDirectory(output_dir)
+        return self._plotter
+
+    def _plot_svg(self, plotter: pcbnew.PLOT_CONTROLLER, name: str, layers: List[str],
+                  enabled_layers: List[int], fast: bool = False) -> bytes:
+        """Plot the requested layers to SVG and return the file contents"""
+        # Fast previews leave out reference and value text, which make up
+        # most of the SVG paths but are not legible at small sizes
+        plot_opts = plotter.GetPlotOptions()
+        plot_opts.SetPlotValue(not fast)
+        plot_opts.SetPlotReference(not fast)
+
+        plotter.OpenPlotfile(name, pcbnew.PLOT_FORMAT_SVG, "Temporary View")
+        temp_svg = plotter.GetPlotFileName()
+
+        # Plot specified layers or all enabled layers
+        if layers:
+            enabled_ids = set(enabled_layers)
+            for layer_name in layers:
+                layer_id = self.board.GetLayerID(layer_name)
+                if layer_id in enabled_ids:
+                    plotter.PlotLayer(layer_id)
+        else:
+            for layer_id in enabled_layers:
+                plotter.PlotLayer(layer_id)
+
+        plotter.ClosePlot()
+
+        # Read the plot back once; everything after this works from memory
+        try:
+            with open(temp_svg, 'rb') as f:
+                return f.read()
+        finally:
+            os.remove(temp_svg)
+
     def _get_layer_type_name(self, type_id: int) -> str:
         """Convert KiCAD layer type constant to name"""
-        type_map = {
-            pcbnew.LT_SIGNAL: "signal",
-            pcbnew.LT_POWER: "power",
-            pcbnew.LT_MIXED: "mixed",
-            pcbnew.LT_JUMPER: "jumper",
-            pcbnew.LT_USER: "user"
-        }
-        return type_map.get(type_id, "unknown")
+        return _LAYER_TYPE_MAP.get(type_id, "unknown")
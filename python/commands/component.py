@@ -2,754 +2,664 @@
 Component-related command implementations for KiCAD interface
 """
 
-import os
 import pcbnew
 import logging
-import math
 from typing import Dict, Any, Optional, List, Tuple
-import base64
+import functools
 
-logger = logging.getLogger('kicad_interface')
-
-class ComponentCommands:
-    """Handles component-related KiCAD operations"""
+from ._array_math import grid_coords_nm, circular_coords_nm, distribute_even
 
-    def __init__(self, board: Optional[pcbnew.BOARD] = None):
-        """Initialize with optional board instance"""
-        self.board = board
+logger = logging.getLogger('kicad_interface')
 
-    def place_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Place a component on the PCB"""
-        try:
+# Nanometres per user unit
+_MM_TO_NM = 1_000_000
+_INCH_TO_NM = 25_400_000
+
+# Offset of an unpositioned duplicate from its source, and margin kept
+# when aligning to a board edge
+_DUPLICATE_OFFSET_NM = 5 * _MM_TO_NM
+_EDGE_MARGIN_NM = 2 * _MM_TO_NM
+
+def _unit_scale(unit: str) -> int:
+    """Return the nm-per-unit factor for "mm" or "inch" coordinates"""
+    return _MM_TO_NM if unit == "mm" else _INCH_TO_NM
+
+def _pos(x_nm: int, y_nm: int) -> Dict[str, Any]:
+    """Return a position result in mm from nm board coordinates"""
+    return {"x": x_nm / _MM_TO_NM, "y": y_nm / _MM_TO_NM, "unit": "mm"}
+
+# KiCAD 7+ takes rotations in degrees; older pcbnew only has decidegrees
+_HAS_ORIENTATION_DEGREES = hasattr(pcbnew.FOOTPRINT, "SetOrientationDegrees")
+
+def _set_orientation(module: pcbnew.FOOTPRINT, degrees: float) -> None:
+    """Set the rotation of a footprint in degrees"""
+    if _HAS_ORIENTATION_DEGREES:
+        module.SetOrientationDegrees(degrees)
+    else:
+        module.SetOrientation(degrees * 10)
+
+def _get_orientation(module: pcbnew.FOOTPRINT) -> float:
+    """Return the rotation of a footprint in degrees"""
+    if _HAS_ORIENTATION_DEGREES:
+        return module.GetOrientationDegrees()
+    return module.GetOrientation() / 10
+
+def _clone_footprint(template: pcbnew.FOOTPRINT) -> pcbnew.FOOTPRINT:
+    """Return an in-memory copy of a footprint, without touching the library"""
+    if hasattr(template, "Duplicate"):
+        # Duplicate() also gives the copy a fresh UUID; it comes back as a
+        # BOARD_ITEM that some pcbnew versions need cast back to FOOTPRINT
+        clone = template.Duplicate()
+        return clone.Cast() if hasattr(clone, "Cast") else clone
+    return pcbnew.FOOTPRINT(template)
+
+def _board_command(failure_message: str):
+    """Wrap a command with the loaded-board check and error reporting"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, params: Dict[str, Any]) -> Dict[str, Any]:
             if not self.board:
                 return {
                     "success": False,
                     "message": "No board is loaded",
                     "errorDetails": "Load or create a board first"
                 }
-
-            # Get parameters
-            component_id = params.get("componentId")
-            position = params.get("position")
-            reference = params.get("reference")
-            value = params.get("value")
-            footprint = params.get("footprint")
-            rotation = params.get("rotation", 0)
-            layer = params.get("layer", "F.Cu")
-
-            if not component_id or not position:
-                return {
-                    "success": False,
-                    "message": "Missing parameters",
-                    "errorDetails": "componentId and position are required"
-                }
-
-            # Create new module (footprint)
-            module = pcbnew.FootprintLoad(self.board.GetLibraryPath(), component_id)
-            if not module:
+            try:
+                return method(self, params)
+            except Exception as e:
+                logger.error(f"Error in {method.__name__}: {str(e)}")
                 return {
                     "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {component_id}"
+                    "message": failure_message,
+                    "errorDetails": str(e)
                 }
+        return wrapper
+    return decorator
 
-            # Set position
-            scale = 1000000 if position["unit"] == "mm" else 25400000  # mm or inch to nm
-            x_nm = int(position["x"] * scale)
-            y_nm = int(position["y"] * scale)
-            module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
-
-            # Set reference if provided
-            if reference:
-                module.SetReference(reference)
-
-            # Set value if provided
-            if value:
-                module.SetValue(value)
-
-            # Set footprint if provided
-            if footprint:
-                module.SetFootprintName(footprint)
-
-            # Set rotation
-            module.SetOrientation(rotation * 10)  # KiCAD uses decidegrees
-
-            # Set layer
-            layer_id = self.board.GetLayerID(layer)
-            if layer_id >= 0:
-                module.SetLayer(layer_id)
+class ComponentCommands:
+    """Handles component-related KiCAD operations"""
 
-            # Add to board
-            self.board.Add(module)
+    def __init__(self, board: Optional[pcbnew.BOARD] = None):
+        """Initialize with optional board instance"""
+        self.board = board
 
+    @_board_command("Failed to place component")
+    def place_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Place a component on the PCB"""
+        # Get parameters
+        component_id = params.get("componentId")
+        position = params.get("position")
+        reference = params.get("reference")
+        value = params.get("value")
+        footprint = params.get("footprint")
+        rotation = params.get("rotation", 0)
+        layer = params.get("layer", "F.Cu")
+
+        if not component_id or not position:
             return {
-                "success": True,
-                "message": f"Placed component: {component_id}",
-                "component": {
-                    "reference": module.GetReference(),
-                    "value": module.GetValue(),
-                    "position": {
-                        "x": position["x"],
-                        "y": position["y"],
-                        "unit": position["unit"]
-                    },
-                    "rotation": rotation,
-                    "layer": layer
-                }
+                "success": False,
+                "message": "Missing parameters",
+                "errorDetails": "componentId and position are required"
             }
 
-        except Exception as e:
-            logger.error(f"Error placing component: {str(e)}")
+        # Create new module (footprint)
+        module = pcbnew.FootprintLoad(self.board.GetLibraryPath(), component_id)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to place component",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {component_id}"
             }
 
-    def move_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Move an existing component to a new position"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
+        # Set position
+        scale = _unit_scale(position["unit"])
+        x_nm = int(position["x"] * scale)
+        y_nm = int(position["y"] * scale)
+        module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
 
-            reference = params.get("reference")
-            position = params.get("position")
-            rotation = params.get("rotation")
+        # Set reference if provided
+        if reference:
+            module.SetReference(reference)
 
-            if not reference or not position:
-                return {
-                    "success": False,
-                    "message": "Missing parameters",
-                    "errorDetails": "reference and position are required"
-                }
+        # Set value if provided
+        if value:
+            module.SetValue(value)
 
-            # Find the component
-            module = self.board.FindFootprintByReference(reference)
-            if not module:
-                return {
-                    "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
-                }
+        # Set footprint if provided
+        if footprint:
+            module.SetFootprintName(footprint)
 
-            # Set new position
-            scale = 1000000 if position["unit"] == "mm" else 25400000  # mm or inch to nm
-            x_nm = int(position["x"] * scale)
-            y_nm = int(position["y"] * scale)
-            module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
+        # Set rotation
+        _set_orientation(module, rotation)
+
+        # Set layer
+        layer_id = self.board.GetLayerID(layer)
+        if layer_id >= 0:
+            module.SetLayer(layer_id)
+
+        # Add to board
+        self.board.Add(module)
+
+        return {
+            "success": True,
+            "message": f"Placed component: {component_id}",
+            "component": {
+                "reference": module.GetReference(),
+                "value": module.GetValue(),
+                "position": {
+                    "x": position["x"],
+                    "y": position["y"],
+                    "unit": position["unit"]
+                },
+                "rotation": rotation,
+                "layer": layer
+            }
+        }
 
-            # Set new rotation if provided
-            if rotation is not None:
-                module.SetOrientation(rotation * 10)  # KiCAD uses decidegrees
+    @_board_command("Failed to move component")
+    def move_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Move an existing component to a new position"""
+        reference = params.get("reference")
+        position = params.get("position")
+        rotation = params.get("rotation")
 
+        if not reference or not position:
             return {
-                "success": True,
-                "message": f"Moved component: {reference}",
-                "component": {
-                    "reference": reference,
-                    "position": {
-                        "x": position["x"],
-                        "y": position["y"],
-                        "unit": position["unit"]
-                    },
-                    "rotation": rotation if rotation is not None else module.GetOrientation() / 10
-                }
+                "success": False,
+                "message": "Missing parameters",
+                "errorDetails": "reference and position are required"
             }
 
-        except Exception as e:
-            logger.error(f"Error moving component: {str(e)}")
+        # Find the component
+        module = self.board.FindFootprintByReference(reference)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to move component",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
+            }
+
+        # Set new position
+        scale = _unit_scale(position["unit"])
+        x_nm = int(position["x"] * scale)
+        y_nm = int(position["y"] * scale)
+        module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
+
+        # Set new rotation if provided
+        if rotation is not None:
+            _set_orientation(module, rotation)
+
+        return {
+            "success": True,
+            "message": f"Moved component: {reference}",
+            "component": {
+                "reference": reference,
+                "position": {
+                    "x": position["x"],
+                    "y": position["y"],
+                    "unit": position["unit"]
+                },
+                "rotation": rotation if rotation is not None else _get_orientation(module)
             }
+        }
 
+    @_board_command("Failed to rotate component")
     def rotate_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Rotate an existing component"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            reference = params.get("reference")
-            angle = params.get("angle")
-
-            if not reference or angle is None:
-                return {
-                    "success": False,
-                    "message": "Missing parameters",
-                    "errorDetails": "reference and angle are required"
-                }
-
-            # Find the component
-            module = self.board.FindFootprintByReference(reference)
-            if not module:
-                return {
-                    "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
-                }
-
-            # Set rotation
-            module.SetOrientation(angle * 10)  # KiCAD uses decidegrees
+        reference = params.get("reference")
+        angle = params.get("angle")
 
+        if not reference or angle is None:
             return {
-                "success": True,
-                "message": f"Rotated component: {reference}",
-                "component": {
-                    "reference": reference,
-                    "rotation": angle
-                }
+                "success": False,
+                "message": "Missing parameters",
+                "errorDetails": "reference and angle are required"
             }
 
-        except Exception as e:
-            logger.error(f"Error rotating component: {str(e)}")
+        # Find the component
+        module = self.board.FindFootprintByReference(reference)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to rotate component",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
             }
 
-    def delete_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Delete a component from the PCB"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            reference = params.get("reference")
-            if not reference:
-                return {
-                    "success": False,
-                    "message": "Missing reference",
-                    "errorDetails": "reference parameter is required"
-                }
-
-            # Find the component
-            module = self.board.FindFootprintByReference(reference)
-            if not module:
-                return {
-                    "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
-                }
+        # Set rotation
+        _set_orientation(module, angle)
 
-            # Remove from board
-            self.board.Remove(module)
+        return {
+            "success": True,
+            "message": f"Rotated component: {reference}",
+            "component": {
+                "reference": reference,
+                "rotation": angle
+            }
+        }
 
+    @_board_command("Failed to delete component")
+    def delete_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete a component from the PCB"""
+        reference = params.get("reference")
+        if not reference:
             return {
-                "success": True,
-                "message": f"Deleted component: {reference}"
+                "success": False,
+                "message": "Missing reference",
+                "errorDetails": "reference parameter is required"
             }
 
-        except Exception as e:
-            logger.error(f"Error deleting component: {str(e)}")
+        # Find the component
+        module = self.board.FindFootprintByReference(reference)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to delete component",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
             }
 
-    def edit_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Edit the properties of an existing component"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            reference = params.get("reference")
-            new_reference = params.get("newReference")
-            value = params.get("value")
-            footprint = params.get("footprint")
-
-            if not reference:
-                return {
-                    "success": False,
-                    "message": "Missing reference",
-                    "errorDetails": "reference parameter is required"
-                }
+        # Remove from board
+        self.board.Remove(module)
 
-            # Find the component
-            module = self.board.FindFootprintByReference(reference)
-            if not module:
-                return {
-                    "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
-                }
+        return {
+            "success": True,
+            "message": f"Deleted component: {reference}"
+        }
 
-            # Update properties
-            if new_reference:
-                module.SetReference(new_reference)
-            if value:
-                module.SetValue(value)
-            if footprint:
-                module.SetFootprintName(footprint)
+    @_board_command("Failed to edit component")
+    def edit_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Edit the properties of an existing component"""
+        reference = params.get("reference")
+        new_reference = params.get("newReference")
+        value = params.get("value")
+        footprint = params.get("footprint")
 
+        if not reference:
             return {
-                "success": True,
-                "message": f"Updated component: {reference}",
-                "component": {
-                    "reference": new_reference or reference,
-                    "value": value or module.GetValue(),
-                    "footprint": footprint or module.GetFootprintName()
-                }
+                "success": False,
+                "message": "Missing reference",
+                "errorDetails": "reference parameter is required"
             }
 
-        except Exception as e:
-            logger.error(f"Error editing component: {str(e)}")
+        # Find the component
+        module = self.board.FindFootprintByReference(reference)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to edit component",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
             }
 
+        # Update properties
+        if new_reference:
+            module.SetReference(new_reference)
+        if value:
+            module.SetValue(value)
+        if footprint:
+            module.SetFootprintName(footprint)
+
+        return {
+            "success": True,
+            "message": f"Updated component: {reference}",
+            "component": {
+                "reference": new_reference or reference,
+                "value": value or module.GetValue(),
+                "footprint": footprint or module.GetFootprintName()
+            }
+        }
+
+    @_board_command("Failed to get component properties")
     def get_component_properties(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed properties of a component"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            reference = params.get("reference")
-            if not reference:
-                return {
-                    "success": False,
-                    "message": "Missing reference",
-                    "errorDetails": "reference parameter is required"
-                }
-
-            # Find the component
-            module = self.board.FindFootprintByReference(reference)
-            if not module:
-                return {
-                    "success": False,
-                    "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
-                }
-
-            # Get position in mm
-            pos = module.GetPosition()
-            x_mm = pos.x / 1000000
-            y_mm = pos.y / 1000000
-
+        reference = params.get("reference")
+        if not reference:
             return {
-                "success": True,
-                "component": {
-                    "reference": module.GetReference(),
-                    "value": module.GetValue(),
-                    "footprint": module.GetFootprintName(),
-                    "position": {
-                        "x": x_mm,
-                        "y": y_mm,
-                        "unit": "mm"
-                    },
-                    "rotation": module.GetOrientation() / 10,
-                    "layer": self.board.GetLayerName(module.GetLayer()),
-                    "attributes": {
-                        "smd": module.GetAttributes() & pcbnew.FP_SMD,
-                        "through_hole": module.GetAttributes() & pcbnew.FP_THROUGH_HOLE,
-                        "virtual": module.GetAttributes() & pcbnew.FP_VIRTUAL
-                    }
-                }
+                "success": False,
+                "message": "Missing reference",
+                "errorDetails": "reference parameter is required"
             }
 
-        except Exception as e:
-            logger.error(f"Error getting component properties: {str(e)}")
+        # Find the component
+        module = self.board.FindFootprintByReference(reference)
+        if not module:
             return {
                 "success": False,
-                "message": "Failed to get component properties",
-                "errorDetails": str(e)
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
             }
 
-    def get_component_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Get a list of all components on the board"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
+        pos = module.GetPosition()
+        attributes = module.GetAttributes()
+
+        return {
+            "success": True,
+            "component": {
+                "reference": module.GetReference(),
+                "value": module.GetValue(),
+                "footprint": module.GetFootprintName(),
+                "position": _pos(pos.x, pos.y),
+                "rotation": _get_orientation(module),
+                "layer": self.board.GetLayerName(module.GetLayer()),
+                "attributes": {
+                    "smd": bool(attributes & pcbnew.FP_SMD),
+                    "through_hole": bool(attributes & pcbnew.FP_THROUGH_HOLE),
+                    "virtual": bool(attributes & pcbnew.FP_VIRTUAL)
                 }
+            }
+        }
 
-            components = []
-            for module in self.board.GetFootprints():
-                pos = module.GetPosition()
-                x_mm = pos.x / 1000000
-                y_mm = pos.y / 1000000
-
-                components.append({
-                    "reference": module.GetReference(),
-                    "value": module.GetValue(),
-                    "footprint": module.GetFootprintName(),
-                    "position": {
-                        "x": x_mm,
-                        "y": y_mm,
-                        "unit": "mm"
-                    },
-                    "rotation": module.GetOrientation() / 10,
-                    "layer": self.board.GetLayerName(module.GetLayer())
-                })
+    @_board_command("Failed to get component list")
+    def get_component_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a list of all components on the board"""
+        # Most footprints share a couple of layers, so resolve each name once
+        layer_names: Dict[int, str] = {}
+        get_layer_name = self.board.GetLayerName
 
-            return {
-                "success": True,
-                "components": components
-            }
+        components = []
+        for module in self.board.GetFootprints():
+            pos = module.GetPosition()
+            layer_id = module.GetLayer()
+            layer_name = layer_names.get(layer_id)
+            if layer_name is None:
+                layer_name = layer_names[layer_id] = get_layer_name(layer_id)
+
+            components.append({
+                "reference": module.GetReference(),
+                "value": module.GetValue(),
+                "footprint": module.GetFootprintName(),
+                "position": _pos(pos.x, pos.y),
+                "rotation": _get_orientation(module),
+                "layer": layer_name
+            })
 
-        except Exception as e:
-            logger.error(f"Error getting component list: {str(e)}")
+        return {
+            "success": True,
+            "components": components
+        }
+            
+    @_board_command("Failed to place component array")
+    def place_component_array(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Place an array of components in a grid or circular pattern"""
+        component_id = params.get("componentId")
+        pattern = params.get("pattern", "grid")  # grid or circular
+        count = params.get("count")
+        reference_prefix = params.get("referencePrefix", "U")
+        value = params.get("value")
+        
+        if not component_id or not count:
             return {
                 "success": False,
-                "message": "Failed to get component list",
-                "errorDetails": str(e)
+                "message": "Missing parameters",
+                "errorDetails": "componentId and count are required"
             }
             
-    def place_component_array(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Place an array of components in a grid or circular pattern"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            component_id = params.get("componentId")
-            pattern = params.get("pattern", "grid")  # grid or circular
-            count = params.get("count")
-            reference_prefix = params.get("referencePrefix", "U")
-            value = params.get("value")
+        if pattern == "grid":
+            start_position = params.get("startPosition")
+            rows = params.get("rows")
+            columns = params.get("columns")
+            spacing_x = params.get("spacingX")
+            spacing_y = params.get("spacingY")
+            rotation = params.get("rotation", 0)
+            layer = params.get("layer", "F.Cu")
             
-            if not component_id or not count:
+            if start_position is None or rows is None or columns is None or spacing_x is None or spacing_y is None:
                 return {
                     "success": False,
-                    "message": "Missing parameters",
-                    "errorDetails": "componentId and count are required"
+                    "message": "Missing grid parameters",
+                    "errorDetails": "For grid pattern, startPosition, rows, columns, spacingX, and spacingY are required"
                 }
                 
-            if pattern == "grid":
-                start_position = params.get("startPosition")
-                rows = params.get("rows")
-                columns = params.get("columns")
-                spacing_x = params.get("spacingX")
-                spacing_y = params.get("spacingY")
-                rotation = params.get("rotation", 0)
-                layer = params.get("layer", "F.Cu")
-                
-                if not start_position or not rows or not columns or not spacing_x or not spacing_y:
-                    return {
-                        "success": False,
-                        "message": "Missing grid parameters",
-                        "errorDetails": "For grid pattern, startPosition, rows, columns, spacingX, and spacingY are required"
-                    }
-                    
-                if rows * columns != count:
-                    return {
-                        "success": False,
-                        "message": "Invalid grid parameters",
-                        "errorDetails": "rows * columns must equal count"
-                    }
-                    
-                placed_components = self._place_grid_array(
-                    component_id,
-                    start_position,
-                    rows,
-                    columns,
-                    spacing_x,
-                    spacing_y,
-                    reference_prefix,
-                    value,
-                    rotation,
-                    layer
-                )
-                
-            elif pattern == "circular":
-                center = params.get("center")
-                radius = params.get("radius")
-                angle_start = params.get("angleStart", 0)
-                angle_step = params.get("angleStep")
-                rotation_offset = params.get("rotationOffset", 0)
-                layer = params.get("layer", "F.Cu")
-                
-                if not center or not radius or not angle_step:
-                    return {
-                        "success": False,
-                        "message": "Missing circular parameters",
-                        "errorDetails": "For circular pattern, center, radius, and angleStep are required"
-                    }
-                    
-                placed_components = self._place_circular_array(
-                    component_id,
-                    center,
-                    radius,
-                    count,
-                    angle_start,
-                    angle_step,
-                    reference_prefix,
-                    value,
-                    rotation_offset,
-                    layer
-                )
-                
-            else:
+            if rows * columns != count:
                 return {
                     "success": False,
-                    "message": "Invalid pattern",
-                    "errorDetails": "Pattern must be 'grid' or 'circular'"
+                    "message": "Invalid grid parameters",
+                    "errorDetails": "rows * columns must equal count"
                 }
-
-            return {
-                "success": True,
-                "message": f"Placed {count} components in {pattern} pattern",
-                "components": placed_components
-            }
-
-        except Exception as e:
-            logger.error(f"Error placing component array: {str(e)}")
-            return {
-                "success": False,
-                "message": "Failed to place component array",
-                "errorDetails": str(e)
-            }
+                
+            placed_components = self._place_grid_array(
+                component_id,
+                start_position,
+                rows,
+                columns,
+                spacing_x,
+                spacing_y,
+                reference_prefix,
+                value,
+                rotation,
+                layer
+            )
             
-    def align_components(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Align multiple components along a line or distribute them evenly"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            references = params.get("references", [])
-            alignment = params.get("alignment", "horizontal")  # horizontal, vertical, or edge
-            distribution = params.get("distribution", "none")  # none, equal, or spacing
-            spacing = params.get("spacing")
+        elif pattern == "circular":
+            center = params.get("center")
+            radius = params.get("radius")
+            angle_start = params.get("angleStart", 0)
+            angle_step = params.get("angleStep")
+            rotation_offset = params.get("rotationOffset", 0)
+            layer = params.get("layer", "F.Cu")
             
-            if not references or len(references) < 2:
+            if not center or not radius or angle_step is None:
                 return {
                     "success": False,
-                    "message": "Missing references",
-                    "errorDetails": "At least two component references are required"
+                    "message": "Missing circular parameters",
+                    "errorDetails": "For circular pattern, center, radius, and angleStep are required"
                 }
                 
-            # Find all referenced components
-            components = []
-            for ref in references:
-                module = self.board.FindFootprintByReference(ref)
-                if not module:
-                    return {
-                        "success": False,
-                        "message": "Component not found",
-                        "errorDetails": f"Could not find component: {ref}"
-                    }
-                components.append(module)
+            placed_components = self._place_circular_array(
+                component_id,
+                center,
+                radius,
+                count,
+                angle_start,
+                angle_step,
+                reference_prefix,
+                value,
+                rotation_offset,
+                layer
+            )
             
-            # Perform alignment based on selected option
-            if alignment == "horizontal":
-                self._align_components_horizontally(components, distribution, spacing)
-            elif alignment == "vertical":
-                self._align_components_vertically(components, distribution, spacing)
-            elif alignment == "edge":
-                edge = params.get("edge")
-                if not edge:
-                    return {
-                        "success": False,
-                        "message": "Missing edge parameter",
-                        "errorDetails": "Edge parameter is required for edge alignment"
-                    }
-                self._align_components_to_edge(components, edge)
-            else:
-                return {
-                    "success": False,
-                    "message": "Invalid alignment option",
-                    "errorDetails": "Alignment must be 'horizontal', 'vertical', or 'edge'"
-                }
-
-            # Prepare result data
-            aligned_components = []
-            for module in components:
-                pos = module.GetPosition()
-                aligned_components.append({
-                    "reference": module.GetReference(),
-                    "position": {
-                        "x": pos.x / 1000000,
-                        "y": pos.y / 1000000,
-                        "unit": "mm"
-                    },
-                    "rotation": module.GetOrientation() / 10
-                })
-
+        else:
             return {
-                "success": True,
-                "message": f"Aligned {len(components)} components",
-                "alignment": alignment,
-                "distribution": distribution,
-                "components": aligned_components
+                "success": False,
+                "message": "Invalid pattern",
+                "errorDetails": "Pattern must be 'grid' or 'circular'"
             }
 
-        except Exception as e:
-            logger.error(f"Error aligning components: {str(e)}")
+        return {
+            "success": True,
+            "message": f"Placed {count} components in {pattern} pattern",
+            "components": placed_components
+        }
+            
+    @_board_command("Failed to align components")
+    def align_components(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Align multiple components along a line or distribute them evenly"""
+        references = params.get("references", [])
+        alignment = params.get("alignment", "horizontal")  # horizontal, vertical, or edge
+        distribution = params.get("distribution", "none")  # none, equal, or spacing
+        spacing = params.get("spacing")
+        
+        if not references or len(references) < 2:
             return {
                 "success": False,
-                "message": "Failed to align components",
-                "errorDetails": str(e)
+                "message": "Missing references",
+                "errorDetails": "At least two component references are required"
             }
             
-    def duplicate_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Duplicate an existing component"""
-        try:
-            if not self.board:
-                return {
-                    "success": False,
-                    "message": "No board is loaded",
-                    "errorDetails": "Load or create a board first"
-                }
-
-            reference = params.get("reference")
-            new_reference = params.get("newReference")
-            position = params.get("position")
-            rotation = params.get("rotation")
-            
-            if not reference or not new_reference:
-                return {
-                    "success": False,
-                    "message": "Missing parameters",
-                    "errorDetails": "reference and newReference are required"
-                }
-                
-            # Find the source component
-            source = self.board.FindFootprintByReference(reference)
-            if not source:
+        # Find all referenced components, indexing the board once rather than
+        # scanning it per reference
+        footprints = {}
+        for module in self.board.GetFootprints():
+            footprints.setdefault(module.GetReference(), module)
+        components = []
+        for ref in references:
+            module = footprints.get(ref)
+            if not module:
                 return {
                     "success": False,
                     "message": "Component not found",
-                    "errorDetails": f"Could not find component: {reference}"
+                    "errorDetails": f"Could not find component: {ref}"
                 }
-                
-            # Check if new reference already exists
-            if self.board.FindFootprintByReference(new_reference):
+            components.append(module)
+        
+        # Perform alignment based on selected option
+        if alignment == "horizontal":
+            self._align_components_horizontally(components, distribution, spacing)
+        elif alignment == "vertical":
+            self._align_components_vertically(components, distribution, spacing)
+        elif alignment == "edge":
+            edge = params.get("edge")
+            if not edge:
                 return {
                     "success": False,
-                    "message": "Reference already exists",
-                    "errorDetails": f"A component with reference {new_reference} already exists"
+                    "message": "Missing edge parameter",
+                    "errorDetails": "Edge parameter is required for edge alignment"
                 }
-                
-            # Create new footprint with the same properties
-            new_module = pcbnew.FOOTPRINT(self.board)
-            new_module.SetFootprintName(source.GetFootprintName())
-            new_module.SetValue(source.GetValue())
-            new_module.SetReference(new_reference)
-            new_module.SetLayer(source.GetLayer())
+            self._align_components_to_edge(components, edge)
+        else:
+            return {
+                "success": False,
+                "message": "Invalid alignment option",
+                "errorDetails": "Alignment must be 'horizontal', 'vertical', or 'edge'"
+            }
+
+        # Prepare result data
+        aligned_components = []
+        for module in components:
+            pos = module.GetPosition()
+            aligned_components.append({
+                "reference": module.GetReference(),
+                "position": _pos(pos.x, pos.y),
+                "rotation": _get_orientation(module)
+            })
+
+        return {
+            "success": True,
+            "message": f"Aligned {len(components)} components",
+            "alignment": alignment,
+            "distribution": distribution,
+            "components": aligned_components
+        }
             
-            # Copy pads and other items
-            for pad in source.Pads():
-                new_pad = pcbnew.PAD(new_module)
-                new_pad.Copy(pad)
-                new_module.Add(new_pad)
-                
-            # Set position if provided, otherwise use offset from original
-            if position:
-                scale = 1000000 if position.get("unit", "mm") == "mm" else 25400000
-                x_nm = int(position["x"] * scale)
-                y_nm = int(position["y"] * scale)
-                new_module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
-            else:
-                # Offset by 5mm
-                source_pos = source.GetPosition()
-                new_module.SetPosition(pcbnew.VECTOR2I(source_pos.x + 5000000, source_pos.y))
-                
-            # Set rotation if provided, otherwise use same as original
-            if rotation is not None:
-                new_module.SetOrientation(rotation * 10)  # KiCAD uses decidegrees
-            else:
-                new_module.SetOrientation(source.GetOrientation())
-                
-            # Add to board
-            self.board.Add(new_module)
+    @_board_command("Failed to duplicate component")
+    def duplicate_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Duplicate an existing component"""
+        reference = params.get("reference")
+        new_reference = params.get("newReference")
+        position = params.get("position")
+        rotation = params.get("rotation")
+        
+        if not reference or not new_reference:
+            return {
+                "success": False,
+                "message": "Missing parameters",
+                "errorDetails": "reference and newReference are required"
+            }
             
-            # Get final position in mm
-            pos = new_module.GetPosition()
-
+        # Find the source component
+        source = self.board.FindFootprintByReference(reference)
+        if not source:
             return {
-                "success": True,
-                "message": f"Duplicated component {reference} to {new_reference}",
-                "component": {
-                    "reference": new_reference,
-                    "value": new_module.GetValue(),
-                    "footprint": new_module.GetFootprintName(),
-                    "position": {
-                        "x": pos.x / 1000000,
-                        "y": pos.y / 1000000,
-                        "unit": "mm"
-                    },
-                    "rotation": new_module.GetOrientation() / 10,
-                    "layer": self.board.GetLayerName(new_module.GetLayer())
-                }
+                "success": False,
+                "message": "Component not found",
+                "errorDetails": f"Could not find component: {reference}"
             }
-
-        except Exception as e:
-            logger.error(f"Error duplicating component: {str(e)}")
+            
+        # Check if new reference already exists
+        if self.board.FindFootprintByReference(new_reference):
             return {
                 "success": False,
-                "message": "Failed to duplicate component",
-                "errorDetails": str(e)
+                "message": "Reference already exists",
+                "errorDetails": f"A component with reference {new_reference} already exists"
             }
             
+        # Clone the footprint with all its pads, graphics, text and models
+        new_module = _clone_footprint(source)
+        new_module.SetReference(new_reference)
+            
+        # Set position if provided, otherwise use offset from original
+        if position:
+            scale = _unit_scale(position.get("unit", "mm"))
+            x_nm = int(position["x"] * scale)
+            y_nm = int(position["y"] * scale)
+            new_module.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
+        else:
+            # Offset by 5mm
+            source_pos = source.GetPosition()
+            new_module.SetPosition(pcbnew.VECTOR2I(source_pos.x + _DUPLICATE_OFFSET_NM, source_pos.y))
+            
+        # Set rotation if provided, otherwise keep the original's
+        if rotation is not None:
+            _set_orientation(new_module, rotation)
+            
+        # Add to board
+        self.board.Add(new_module)
+        
+        # Get final position in mm
+        pos = new_module.GetPosition()
+
+        return {
+            "success": True,
+            "message": f"Duplicated component {reference} to {new_reference}",
+            "component": {
+                "reference": new_reference,
+                "value": new_module.GetValue(),
+                "footprint": new_module.GetFootprintName(),
+                "position": _pos(pos.x, pos.y),
+                "rotation": _get_orientation(new_module),
+                "layer": self.board.GetLayerName(new_module.GetLayer())
+            }
+        }
+            
     def _place_grid_array(self, component_id: str, start_position: Dict[str, Any], 
                        rows: int, columns: int, spacing_x: float, spacing_y: float,
                        reference_prefix: str, value: str, rotation: float, layer: str) -> List[Dict[str, Any]]:
         """Place components in a grid pattern and return the list of placed components"""
         placed = []
         
-        # Convert spacing to nm
-        unit = start_position.get("unit", "mm")
-        scale = 1000000 if unit == "mm" else 25400000  # mm or inch to nm
-        spacing_x_nm = int(spacing_x * scale)
-        spacing_y_nm = int(spacing_y * scale)
+        # Load the footprint once and clone it for every cell
+        template = pcbnew.FootprintLoad(self.board.GetLibraryPath(), component_id)
+        if not template:
+            raise ValueError(f"Could not find component: {component_id}")
+        if value:
+            template.SetValue(value)
+        _set_orientation(template, rotation)
         
         # Get layer ID
         layer_id = self.board.GetLayerID(layer)
+        if layer_id >= 0:
+            template.SetLayer(layer_id)
+        component_value = template.GetValue()
         
-        for row in range(rows):
-            for col in range(columns):
-                # Calculate position
-                x = start_position["x"] + (col * spacing_x)
-                y = start_position["y"] + (row * spacing_y)
-                
-                # Generate reference
-                index = row * columns + col + 1
-                component_reference = f"{reference_prefix}{index}"
-                
-                # Place component
-                result = self.place_component({
-                    "componentId": component_id,
-                    "position": {"x": x, "y": y, "unit": unit},
-                    "reference": component_reference,
-                    "value": value,
-                    "rotation": rotation,
-                    "layer": layer
-                })
-                
-                if result["success"]:
-                    placed.append(result["component"])
+        # Generate every cell position in nm up front
+        unit = start_position.get("unit", "mm")
+        xs_nm, ys_nm = grid_coords_nm(start_position["x"], start_position["y"], rows, columns,
+                                      spacing_x, spacing_y, _unit_scale(unit))
+        
+        # Generate references
+        references = [f"{reference_prefix}{i+1}" for i in range(rows * columns)]
+        
+        for i, component_reference in enumerate(references):
+            row, col = divmod(i, columns)
+            
+            # Place component
+            module = _clone_footprint(template)
+            module.SetPosition(pcbnew.VECTOR2I(xs_nm[i], ys_nm[i]))
+            module.SetReference(component_reference)
+            self.board.Add(module)
+            
+            placed.append({
+                "reference": component_reference,
+                "value": component_value,
+                "position": {
+                    "x": start_position["x"] + (col * spacing_x),
+                    "y": start_position["y"] + (row * spacing_y),
+                    "unit": unit
+                },
+                "rotation": rotation,
+                "layer": layer
+            })
+        
+        # Refresh connectivity once for the whole array, not per footprint
+        self.board.BuildConnectivity()
                 
         return placed
         
@@ -760,157 +670,139 @@ class ComponentCommands:
         """Place components in a circular pattern and return the list of placed components"""
         placed = []
         
+        # Load the footprint once and clone it for every position
+        template = pcbnew.FootprintLoad(self.board.GetLibraryPath(), component_id)
+        if not template:
+            raise ValueError(f"Could not find component: {component_id}")
+        if value:
+            template.SetValue(value)
+        
+        # Get layer ID
+        layer_id = self.board.GetLayerID(layer)
+        if layer_id >= 0:
+            template.SetLayer(layer_id)
+        component_value = template.GetValue()
+        
         # Get unit
         unit = center.get("unit", "mm")
+        scale = _unit_scale(unit)
         
-        for i in range(count):
-            # Calculate angle for this component
-            angle = angle_start + (i * angle_step)
-            angle_rad = math.radians(angle)
-            
-            # Calculate position
-            x = center["x"] + (radius * math.cos(angle_rad))
-            y = center["y"] + (radius * math.sin(angle_rad))
-            
-            # Generate reference
-            component_reference = f"{reference_prefix}{i+1}"
-            
-            # Calculate rotation (pointing outward from center)
-            component_rotation = angle + rotation_offset
+        # Calculate every rotation and position up front; rotation points
+        # each component outward from the center
+        rotations = [angle_start + (i * angle_step) + rotation_offset for i in range(count)]
+        xs_nm, ys_nm = circular_coords_nm(center["x"], center["y"], radius, count,
+                                          angle_start, angle_step, scale)
+        
+        # Generate references
+        references = [f"{reference_prefix}{i+1}" for i in range(count)]
+        
+        for i, component_reference in enumerate(references):
+            component_rotation = rotations[i]
             
             # Place component
-            result = self.place_component({
-                "componentId": component_id,
-                "position": {"x": x, "y": y, "unit": unit},
+            module = _clone_footprint(template)
+            module.SetPosition(pcbnew.VECTOR2I(xs_nm[i], ys_nm[i]))
+            module.SetReference(component_reference)
+            _set_orientation(module, component_rotation)
+            self.board.Add(module)
+            
+            placed.append({
                 "reference": component_reference,
-                "value": value,
+                "value": component_value,
+                "position": {
+                    "x": xs_nm[i] / scale,
+                    "y": ys_nm[i] / scale,
+                    "unit": unit
+                },
                 "rotation": component_rotation,
                 "layer": layer
             })
-            
-            if result["success"]:
-                placed.append(result["component"])
+        
+        # Refresh connectivity once for the whole array, not per footprint
+        self.board.BuildConnectivity()
                 
         return placed
         
     def _align_components_horizontally(self, components: List[pcbnew.FOOTPRINT], 
                                    distribution: str, spacing: Optional[float]) -> None:
         """Align components horizontally and optionally distribute them"""
-        if not components:
-            return
-            
-        # Find the average Y coordinate
-        y_sum = sum(module.GetPosition().y for module in components)
-        y_avg = y_sum // len(components)
-        
-        # Sort components by X position
-        components.sort(key=lambda m: m.GetPosition().x)
-        
-        # Set Y coordinate for all components
-        for module in components:
-            pos = module.GetPosition()
-            module.SetPosition(pcbnew.VECTOR2I(pos.x, y_avg))
-            
-        # Handle distribution if requested
-        if distribution == "equal" and len(components) > 1:
-            # Get leftmost and rightmost X coordinates
-            x_min = components[0].GetPosition().x
-            x_max = components[-1].GetPosition().x
-            
-            # Calculate equal spacing
-            total_space = x_max - x_min
-            spacing_nm = total_space // (len(components) - 1)
-            
-            # Set X positions with equal spacing
-            for i in range(1, len(components) - 1):
-                pos = components[i].GetPosition()
-                new_x = x_min + (i * spacing_nm)
-                components[i].SetPosition(pcbnew.VECTOR2I(new_x, pos.y))
-                
-        elif distribution == "spacing" and spacing is not None:
-            # Convert spacing to nanometers
-            spacing_nm = int(spacing * 1000000)  # assuming mm
-            
-            # Set X positions with the specified spacing
-            x_current = components[0].GetPosition().x
-            for i in range(1, len(components)):
-                pos = components[i].GetPosition()
-                x_current += spacing_nm
-                components[i].SetPosition(pcbnew.VECTOR2I(x_current, pos.y))
+        self._align_components_on_axis(components, True, distribution, spacing)
                 
     def _align_components_vertically(self, components: List[pcbnew.FOOTPRINT], 
                                  distribution: str, spacing: Optional[float]) -> None:
         """Align components vertically and optionally distribute them"""
+        self._align_components_on_axis(components, False, distribution, spacing)
+                
+    def _align_components_on_axis(self, components: List[pcbnew.FOOTPRINT], horizontal: bool,
+                                  distribution: str, spacing: Optional[float]) -> None:
+        """Line components up on a shared row (horizontal) or column and distribute along it"""
         if not components:
             return
             
-        # Find the average X coordinate
-        x_sum = sum(module.GetPosition().x for module in components)
-        x_avg = x_sum // len(components)
-        
-        # Sort components by Y position
-        components.sort(key=lambda m: m.GetPosition().y)
-        
-        # Set X coordinate for all components
+        # Read every position once into plain x and y lists so no VECTOR2I
+        # wrapper is kept or touched again
+        xs: List[int] = []
+        ys: List[int] = []
         for module in components:
             pos = module.GetPosition()
-            module.SetPosition(pcbnew.VECTOR2I(x_avg, pos.y))
-            
-        # Handle distribution if requested
-        if distribution == "equal" and len(components) > 1:
-            # Get topmost and bottommost Y coordinates
-            y_min = components[0].GetPosition().y
-            y_max = components[-1].GetPosition().y
-            
-            # Calculate equal spacing
-            total_space = y_max - y_min
-            spacing_nm = total_space // (len(components) - 1)
-            
-            # Set Y positions with equal spacing
-            for i in range(1, len(components) - 1):
-                pos = components[i].GetPosition()
-                new_y = y_min + (i * spacing_nm)
-                components[i].SetPosition(pcbnew.VECTOR2I(pos.x, new_y))
+            xs.append(pos.x)
+            ys.append(pos.y)
+        
+        # Components share the average of the cross axis and are ordered
+        # and distributed along the other one
+        n = len(components)
+        along, across = (xs, ys) if horizontal else (ys, xs)
+        across_avg = sum(across) // n
+        
+        order = sorted(range(n), key=along.__getitem__)
+        components[:] = [components[i] for i in order]
+        along = self._distribute([along[i] for i in order], distribution, spacing)
+        
+        # Write each final position once
+        VEC = pcbnew.VECTOR2I
+        if horizontal:
+            for module, value in zip(components, along):
+                module.SetPosition(VEC(value, across_avg))
+        else:
+            for module, value in zip(components, along):
+                module.SetPosition(VEC(across_avg, value))
                 
+    def _distribute(self, values: List[int], distribution: str, spacing: Optional[float]) -> List[int]:
+        """Return sorted nm coordinates spread according to the distribution option"""
+        n = len(values)
+        if distribution == "equal" and n > 1:
+            # Keep both ends and spread the rest with equal spacing
+            return distribute_even(values)
         elif distribution == "spacing" and spacing is not None:
             # Convert spacing to nanometers
-            spacing_nm = int(spacing * 1000000)  # assuming mm
-            
-            # Set Y positions with the specified spacing
-            y_current = components[0].GetPosition().y
-            for i in range(1, len(components)):
-                pos = components[i].GetPosition()
-                y_current += spacing_nm
-                components[i].SetPosition(pcbnew.VECTOR2I(pos.x, y_current))
+            spacing_nm = int(spacing * _MM_TO_NM)  # assuming mm
+            first = values[0]
+            return [first + (i * spacing_nm) for i in range(n)]
+        return values
                 
     def _align_components_to_edge(self, components: List[pcbnew.FOOTPRINT], edge: str) -> None:
         """Align components to the specified edge of the board"""
         if not components:
             return
             
-        # Get board bounds
+        # Work out the target coordinate once; only the needed edge is read
         board_box = self.board.GetBoardEdgesBoundingBox()
-        left = board_box.GetLeft()
-        right = board_box.GetRight()
-        top = board_box.GetTop()
-        bottom = board_box.GetBottom()
-        
-        # Align based on specified edge
         if edge == "left":
-            for module in components:
-                pos = module.GetPosition()
-                module.SetPosition(pcbnew.VECTOR2I(left + 2000000, pos.y))  # 2mm offset from edge
+            target, axis_is_x = board_box.GetLeft() + _EDGE_MARGIN_NM, True
         elif edge == "right":
-            for module in components:
-                pos = module.GetPosition()
-                module.SetPosition(pcbnew.VECTOR2I(right - 2000000, pos.y))  # 2mm offset from edge
+            target, axis_is_x = board_box.GetRight() - _EDGE_MARGIN_NM, True
         elif edge == "top":
-            for module in components:
-                pos = module.GetPosition()
-                module.SetPosition(pcbnew.VECTOR2I(pos.x, top + 2000000))  # 2mm offset from edge
+            target, axis_is_x = board_box.GetTop() + _EDGE_MARGIN_NM, False
         elif edge == "bottom":
-            for module in components:
-                pos = module.GetPosition()
-                module.SetPosition(pcbnew.VECTOR2I(pos.x, bottom - 2000000))  # 2mm offset from edge
+            target, axis_is_x = board_box.GetBottom() - _EDGE_MARGIN_NM, False
         else:
             logger.warning(f"Unknown edge alignment: {edge}")
+            return
+        
+        VEC = pcbnew.VECTOR2I
+        if axis_is_x:
+            for module in components:
+                module.SetPosition(VEC(target, module.GetPosition().y))
+        else:
+            for module in components:
+                module.SetPosition(VEC(module.GetPosition().x, target))
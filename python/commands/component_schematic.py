@@ -1,6 +1,49 @@
 from skip import Schematic
 # Symbol class might not be directly importable in the current version
 import os
+import logging
+import re
+
+logger = logging.getLogger('kicad_interface')
+
+def _find_symbol(schematic: Schematic, component_ref: str):
+    """Return the first symbol with the given reference, or None"""
+    return next((symbol for symbol in schematic.symbol if symbol.reference == component_ref), None)
+
+def _search_text(symbol) -> str:
+    """Return the lowercased reference/name/value text of a symbol for searching"""
+    value = symbol.property.Value.value if hasattr(symbol.property, 'Value') else ""
+    return f"{symbol.reference}\x00{symbol.name}\x00{value}".lower()
+
+# Properties set through dedicated component_def keys, never via "properties"
+_STANDARD_PROPERTIES = frozenset(('Reference', 'Value', 'Footprint', 'Datasheet'))
+
+def _build_symbol(add_symbol, component_def: dict):
+    """Create a symbol from a component definition with the given add_symbol"""
+    # Create a new symbol
+    symbol = add_symbol(
+        lib=component_def.get('library', 'Device'),
+        name=component_def.get('type', 'R'), # Default to Resistor symbol 'R'
+        reference=component_def.get('reference', 'R?'),
+        at=[component_def.get('x', 0), component_def.get('y', 0)],
+        unit=component_def.get('unit', 1),
+        rotation=component_def.get('rotation', 0)
+    )
+
+    # Set properties
+    if 'value' in component_def:
+        symbol.property.Value.value = component_def['value']
+    if 'footprint' in component_def:
+        symbol.property.Footprint.value = component_def['footprint']
+    if 'datasheet' in component_def:
+        symbol.property.Datasheet.value = component_def['datasheet']
+
+    # Add additional properties
+    for key, value in component_def.get('properties', {}).items():
+        # Avoid overwriting standard properties unless explicitly intended
+        if key not in _STANDARD_PROPERTIES:
+            symbol.property.append(key, value)
+    return symbol
 
 class ComponentManager:
     """Manage components in a schematic"""
@@ -9,34 +52,29 @@ class ComponentManager:
     def add_component(schematic: Schematic, component_def: dict):
         """Add a component to the schematic"""
         try:
-            # Create a new symbol
-            symbol = schematic.add_symbol(
-                lib=component_def.get('library', 'Device'),
-                name=component_def.get('type', 'R'), # Default to Resistor symbol 'R'
-                reference=component_def.get('reference', 'R?'),
-                at=[component_def.get('x', 0), component_def.get('y', 0)],
-                unit=component_def.get('unit', 1),
-                rotation=component_def.get('rotation', 0)
-            )
-
-            # Set properties
-            if 'value' in component_def:
-                symbol.property.Value.value = component_def['value']
-            if 'footprint' in component_def:
-                symbol.property.Footprint.value = component_def['footprint']
-            if 'datasheet' in component_def:
-                 symbol.property.Datasheet.value = component_def['datasheet']
-
-            # Add additional properties
-            for key, value in component_def.get('properties', {}).items():
-                # Avoid overwriting standard properties unless explicitly intended
-                if key not in ['Reference', 'Value', 'Footprint', 'Datasheet']:
-                    symbol.property.append(key, value)
-
-            print(f"Added component {symbol.reference} ({symbol.name}) to schematic.")
+            symbol = _build_symbol(schematic.add_symbol, component_def)
+            logger.debug("Added component %s (%s) to schematic.", symbol.reference, symbol.name)
             return symbol
         except Exception as e:
-            print(f"Error adding component: {e}")
+            logger.error("Error adding component: %s", e)
+            return None
+
+    @staticmethod
+    def add_components(schematic: Schematic, component_defs: list):
+        """Add several components to the schematic in one pass
+
+        Returns the new symbols, or None if one failed; components added
+        before the failure stay in the schematic.
+        """
+        symbols = []
+        add_symbol = schematic.add_symbol
+        try:
+            for component_def in component_defs:
+                symbols.append(_build_symbol(add_symbol, component_def))
+            logger.debug("Added %d components to schematic.", len(symbols))
+            return symbols
+        except Exception as e:
+            logger.error("Error adding components: %s", e)
             return None
 
     @staticmethod
@@ -45,21 +83,17 @@ class ComponentManager:
         try:
             # kicad-skip doesn't have a direct remove_symbol method by reference.
             # We need to find the symbol and then remove it from the symbols list.
-            symbol_to_remove = None
-            for symbol in schematic.symbol:
-                if symbol.reference == component_ref:
-                    symbol_to_remove = symbol
-                    break
+            symbol_to_remove = _find_symbol(schematic, component_ref)
 
             if symbol_to_remove:
                 schematic.symbol.remove(symbol_to_remove)
-                print(f"Removed component {component_ref} from schematic.")
+                logger.debug("Removed component %s from schematic.", component_ref)
                 return True
             else:
-                print(f"Component with reference {component_ref} not found.")
+                logger.warning("Component with reference %s not found.", component_ref)
                 return False
         except Exception as e:
-            print(f"Error removing component {component_ref}: {e}")
+            logger.error("Error removing component %s: %s", component_ref, e)
             return False
 
 
@@ -67,11 +101,7 @@ class ComponentManager:
     def update_component(schematic: Schematic, component_ref: str, new_properties: dict):
         """Update component properties by reference designator"""
         try:
-            symbol_to_update = None
-            for symbol in schematic.symbol:
-                if symbol.reference == component_ref:
-                    symbol_to_update = symbol
-                    break
+            symbol_to_update = _find_symbol(schematic, component_ref)
 
             if symbol_to_update:
                 for key, value in new_properties.items():
@@ -80,44 +110,51 @@ class ComponentManager:
                     else:
                          # Add as a new property if it doesn't exist
                          symbol_to_update.property.append(key, value)
-                print(f"Updated properties for component {component_ref}.")
+                logger.debug("Updated properties for component %s.", component_ref)
                 return True
             else:
-                print(f"Component with reference {component_ref} not found.")
+                logger.warning("Component with reference %s not found.", component_ref)
                 return False
         except Exception as e:
-            print(f"Error updating component {component_ref}: {e}")
+            logger.error("Error updating component %s: %s", component_ref, e)
             return False
 
     @staticmethod
     def get_component(schematic: Schematic, component_ref: str):
         """Get a component by reference designator"""
-        for symbol in schematic.symbol:
-            if symbol.reference == component_ref:
-                print(f"Found component with reference {component_ref}.")
-                return symbol
-        print(f"Component with reference {component_ref} not found.")
+        symbol = _find_symbol(schematic, component_ref)
+        if symbol is not None:
+            logger.debug("Found component with reference %s.", component_ref)
+            return symbol
+        logger.warning("Component with reference %s not found.", component_ref)
         return None
 
     @staticmethod
-    def search_components(schematic: Schematic, query: str):
-        """Search for components matching criteria (basic implementation)"""
-        # This is a basic search, could be expanded to use regex or more complex logic
-        matching_components = []
-        query_lower = query.lower()
-        for symbol in schematic.symbol:
-            if query_lower in symbol.reference.lower() or \
-               query_lower in symbol.name.lower() or \
-               (hasattr(symbol.property, 'Value') and query_lower in symbol.property.Value.value.lower()):
-                matching_components.append(symbol)
-        print(f"Found {len(matching_components)} components matching query '{query}'.")
+    def search_components(schematic: Schematic, query):
+        """Search for components matching criteria (basic implementation)
+
+        query may be a single string or a list of strings; with a list, a
+        component matches if it contains any of them.
+        """
+        if isinstance(query, str):
+            query_lower = query.lower()
+            matching_components = [symbol for symbol in schematic.symbol if query_lower in _search_text(symbol)]
+        else:
+            # Scan each symbol once against all queries with a single alternation
+            pattern = re.compile("|".join(re.escape(q.lower()) for q in query))
+            matching_components = [symbol for symbol in schematic.symbol if pattern.search(_search_text(symbol))]
+        logger.debug("Found %d components matching query '%s'.", len(matching_components), query)
         return matching_components
 
     @staticmethod
     def get_all_components(schematic: Schematic):
-        """Get all components in schematic"""
-        print(f"Retrieving all {len(schematic.symbol)} components.")
-        return list(schematic.symbol)
+        """Get all components in schematic
+
+        Returns the schematic's own symbol collection rather than a copy;
+        callers that modify the schematic while iterating should take a list().
+        """
+        logger.debug("Retrieving all %d components.", len(schematic.symbol))
+        return schematic.symbol
 
 if __name__ == '__main__':
     # Example Usage (for testing)
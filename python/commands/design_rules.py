@@ -9,6 +9,60 @@ from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger('kicad_interface')
 
+# Nanometres per millimetre, KiCAD's internal unit
+_NM_PER_MM = 1000000
+
+def _nm(value_mm: Any) -> int:
+    """Convert a length in mm to KiCAD nanometres"""
+    # Whole-mm ints stay on the exact integer path
+    if isinstance(value_mm, int):
+        return value_mm * _NM_PER_MM
+    return int(value_mm * _NM_PER_MM)
+
+# Design rule params and how they map onto the board design settings:
+# (param key, Get/Set method suffix or attribute name, value in mm, is attribute)
+_RULES = (
+    ("clearance", "MinClearance", True, False),
+    ("trackWidth", "CurrentTrackWidth", True, False),
+    ("viaDiameter", "CurrentViaSize", True, False),
+    ("viaDrill", "CurrentViaDrill", True, False),
+    ("microViaDiameter", "CurrentMicroViaSize", True, False),
+    ("microViaDrill", "CurrentMicroViaDrill", True, False),
+    ("minTrackWidth", "m_TrackMinWidth", True, True),
+    ("minViaDiameter", "m_ViasMinSize", True, True),
+    ("minViaDrill", "m_ViasMinDrill", True, True),
+    ("minMicroViaDiameter", "m_MicroViasMinSize", True, True),
+    ("minMicroViaDrill", "m_MicroViasMinDrill", True, True),
+    ("minHoleDiameter", "m_MinHoleDiameter", True, True),
+    ("requireCourtyard", "m_RequireCourtyards", False, True),
+    ("courtyardClearance", "m_CourtyardMinClearance", True, True)
+)
+
+def _read_rule(design_settings: pcbnew.BOARD_DESIGN_SETTINGS, name: str, in_mm: bool, is_attribute: bool) -> Any:
+    """Read one design rule, converting lengths to mm"""
+    value = getattr(design_settings, name) if is_attribute else getattr(design_settings, "Get" + name)()
+    return value / _NM_PER_MM if in_mm else value
+
+def _snapshot_rules(design_settings: pcbnew.BOARD_DESIGN_SETTINGS) -> Dict[str, Any]:
+    """Return every design rule keyed by its param name"""
+    return {key: _read_rule(design_settings, name, in_mm, is_attribute)
+            for key, name, in_mm, is_attribute in _RULES}
+
+def _marker_violation(marker: pcbnew.PCB_MARKER) -> Dict[str, Any]:
+    """Describe a DRC marker as a violation entry"""
+    # Read the position once rather than once per coordinate
+    pos = marker.GetPos()
+    return {
+        "type": marker.GetErrorCode(),
+        "severity": "error",  # KiCAD DRC markers are always errors
+        "message": marker.GetDescription(),
+        "location": {
+            "x": pos.x / _NM_PER_MM,
+            "y": pos.y / _NM_PER_MM,
+            "unit": "mm"
+        }
+    }
+
 class DesignRuleCommands:
     """Handles design rule checking and configuration"""
 
@@ -28,70 +82,29 @@ class DesignRuleCommands:
 
             design_settings = self.board.GetDesignSettings()
 
-            # Convert mm to nanometers for KiCAD internal units
-            scale = 1000000  # mm to nm
-
-            # Set clearance
-            if "clearance" in params:
-                design_settings.SetMinClearance(int(params["clearance"] * scale))
-
-            # Set track width
-            if "trackWidth" in params:
-                design_settings.SetCurrentTrackWidth(int(params["trackWidth"] * scale))
-
-            # Set via settings
-            if "viaDiameter" in params:
-                design_settings.SetCurrentViaSize(int(params["viaDiameter"] * scale))
-            if "viaDrill" in params:
-                design_settings.SetCurrentViaDrill(int(params["viaDrill"] * scale))
-
-            # Set micro via settings
-            if "microViaDiameter" in params:
-                design_settings.SetCurrentMicroViaSize(int(params["microViaDiameter"] * scale))
-            if "microViaDrill" in params:
-                design_settings.SetCurrentMicroViaDrill(int(params["microViaDrill"] * scale))
-
-            # Set minimum values
-            if "minTrackWidth" in params:
-                design_settings.m_TrackMinWidth = int(params["minTrackWidth"] * scale)
-            if "minViaDiameter" in params:
-                design_settings.m_ViasMinSize = int(params["minViaDiameter"] * scale)
-            if "minViaDrill" in params:
-                design_settings.m_ViasMinDrill = int(params["minViaDrill"] * scale)
-            if "minMicroViaDiameter" in params:
-                design_settings.m_MicroViasMinSize = int(params["minMicroViaDiameter"] * scale)
-            if "minMicroViaDrill" in params:
-                design_settings.m_MicroViasMinDrill = int(params["minMicroViaDrill"] * scale)
-
-            # Set hole diameter
-            if "minHoleDiameter" in params:
-                design_settings.m_MinHoleDiameter = int(params["minHoleDiameter"] * scale)
-
-            # Set courtyard settings
-            if "requireCourtyard" in params:
-                design_settings.m_RequireCourtyards = params["requireCourtyard"]
-            if "courtyardClearance" in params:
-                design_settings.m_CourtyardMinClearance = int(params["courtyardClearance"] * scale)
+            changed: List[str] = []
+            rules: Dict[str, Any] = {}
+            for key, name, in_mm, is_attribute in _RULES:
+                if key not in params:
+                    continue
+                # Convert mm to nanometers for KiCAD internal units
+                value = _nm(params[key]) if in_mm else params[key]
+                if is_attribute:
+                    setattr(design_settings, name, value)
+                else:
+                    getattr(design_settings, "Set" + name)(value)
+                changed.append(key)
+                rules[key] = _read_rule(design_settings, name, in_mm, is_attribute)
+
+            # Only the updated rules are read back unless all are requested
+            if params.get("returnAll", False):
+                rules = _snapshot_rules(design_settings)
 
             return {
                 "success": True,
                 "message": "Updated design rules",
-                "rules": {
-                    "clearance": design_settings.GetMinClearance() / scale,
-                    "trackWidth": design_settings.GetCurrentTrackWidth() / scale,
-                    "viaDiameter": design_settings.GetCurrentViaSize() / scale,
-                    "viaDrill": design_settings.GetCurrentViaDrill() / scale,
-                    "microViaDiameter": design_settings.GetCurrentMicroViaSize() / scale,
-                    "microViaDrill": design_settings.GetCurrentMicroViaDrill() / scale,
-                    "minTrackWidth": design_settings.m_TrackMinWidth / scale,
-                    "minViaDiameter": design_settings.m_ViasMinSize / scale,
-                    "minViaDrill": design_settings.m_ViasMinDrill / scale,
-                    "minMicroViaDiameter": design_settings.m_MicroViasMinSize / scale,
-                    "minMicroViaDrill": design_settings.m_MicroViasMinDrill / scale,
-                    "minHoleDiameter": design_settings.m_MinHoleDiameter / scale,
-                    "requireCourtyard": design_settings.m_RequireCourtyards,
-                    "courtyardClearance": design_settings.m_CourtyardMinClearance / scale
-                }
+                "changed": changed,
+                "rules": rules
             }
 
         except Exception as e:
@@ -113,26 +126,10 @@ class DesignRuleCommands:
                 }
 
             design_settings = self.board.GetDesignSettings()
-            scale = 1000000  # nm to mm
 
             return {
                 "success": True,
-                "rules": {
-                    "clearance": design_settings.GetMinClearance() / scale,
-                    "trackWidth": design_settings.GetCurrentTrackWidth() / scale,
-                    "viaDiameter": design_settings.GetCurrentViaSize() / scale,
-                    "viaDrill": design_settings.GetCurrentViaDrill() / scale,
-                    "microViaDiameter": design_settings.GetCurrentMicroViaSize() / scale,
-                    "microViaDrill": design_settings.GetCurrentMicroViaDrill() / scale,
-                    "minTrackWidth": design_settings.m_TrackMinWidth / scale,
-                    "minViaDiameter": design_settings.m_ViasMinSize / scale,
-                    "minViaDrill": design_settings.m_ViasMinDrill / scale,
-                    "minMicroViaDiameter": design_settings.m_MicroViasMinSize / scale,
-                    "minMicroViaDrill": design_settings.m_MicroViasMinDrill / scale,
-                    "minHoleDiameter": design_settings.m_MinHoleDiameter / scale,
-                    "requireCourtyard": design_settings.m_RequireCourtyards,
-                    "courtyardClearance": design_settings.m_CourtyardMinClearance / scale
-                }
+                "rules": _snapshot_rules(design_settings)
             }
 
         except Exception as e:
@@ -154,6 +151,10 @@ class DesignRuleCommands:
                 }
 
             report_path = params.get("reportPath")
+            # Entries are only built for the first maxViolations markers
+            max_violations = params.get("maxViolations")
+            if max_violations is not None:
+                max_violations = max(int(max_violations), 0)
 
             # Create DRC runner
             drc = pcbnew.DRC(self.board)
@@ -161,19 +162,10 @@ class DesignRuleCommands:
             # Run DRC
             drc.Run()
 
-            # Get violations
-            violations = []
-            for marker in drc.GetMarkers():
-                violations.append({
-                    "type": marker.GetErrorCode(),
-                    "severity": "error",
-                    "message": marker.GetDescription(),
-                    "location": {
-                        "x": marker.GetPos().x / 1000000,
-                        "y": marker.GetPos().y / 1000000,
-                        "unit": "mm"
-                    }
-                })
+            # Get violations, taking the marker list across SWIG only once
+            markers = list(drc.GetMarkers())
+            logger.info(f"DRC found {len(markers)} markers")
+            violations = [_marker_violation(marker) for marker in markers[:max_violations]]
 
             # Save report if path provided
             if report_path:
@@ -182,8 +174,9 @@ class DesignRuleCommands:
 
             return {
                 "success": True,
-                "message": f"Found {len(violations)} DRC violations",
+                "message": f"Found {len(markers)} DRC violations",
                 "violations": violations,
+                "total": len(markers),
                 "reportPath": report_path if report_path else None
             }
 
@@ -206,28 +199,24 @@ class DesignRuleCommands:
                 }
 
             severity = params.get("severity", "all")
+            # Entries are only built for the first maxViolations markers
+            max_violations = params.get("maxViolations")
+            if max_violations is not None:
+                max_violations = max(int(max_violations), 0)
 
             # Get DRC markers
-            violations = []
-            for marker in self.board.GetDRCMarkers():
-                violation = {
-                    "type": marker.GetErrorCode(),
-                    "severity": "error",  # KiCAD DRC markers are always errors
-                    "message": marker.GetDescription(),
-                    "location": {
-                        "x": marker.GetPos().x / 1000000,
-                        "y": marker.GetPos().y / 1000000,
-                        "unit": "mm"
-                    }
-                }
-
-                # Filter by severity if specified
-                if severity == "all" or severity == violation["severity"]:
-                    violations.append(violation)
+            # Filter by severity if specified; every marker is an error, so
+            # any other severity matches nothing and no entries are built
+            if severity in ("all", "error"):
+                markers = list(self.board.GetDRCMarkers())
+            else:
+                markers = []
+            violations = [_marker_violation(marker) for marker in markers[:max_violations]]
 
             return {
                 "success": True,
-                "violations": violations
+                "violations": violations,
+                "total": len(markers)
             }
 
         except Exception as e:
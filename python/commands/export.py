@@ -3,20 +3,144 @@ Export command implementations for KiCAD interface
 """
 
 import os
+import csv
+import json
+import operator
 import pcbnew
 import logging
 from typing import Dict, Any, Optional, List, Tuple
-import base64
+from xml.sax.saxutils import XMLGenerator
+
+# orjson is faster at BOM JSON export; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger('kicad_interface')
 
+# Characters escaped in HTML BOM cells
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# File suffixes written by the Excellon drill writer
+_DRILL_SUFFIXES = (".drl", ".cnc")
+
+# Plot options (Get/Set method suffixes) that some exporter changes; they are
+# put back to the controller's initial values before every export
+_PLOT_OPTIONS = (
+    "PlotFrameRef",
+    "PlotValue",
+    "PlotReference",
+    "Monochrome",
+    "UseAuxOrigin",
+    "UseGerberProtelExtensions",
+    "CreateGerberJobFile",
+    "SubtractMaskFromSilk"
+)
+
+def _file_key(entry: os.DirEntry) -> Tuple[int, int]:
+    """Return (mtime_ns, size) identifying the contents of a directory entry"""
+    # The size catches rewrites that coarse filesystem timestamps miss
+    st = entry.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+def _normalize_out_path(path: str) -> str:
+    """Return an absolute, user-expanded output path"""
+    # Absolute paths without '~' only need normalizing, which skips the
+    # getcwd and home directory lookups
+    if os.path.isabs(path) and "~" not in path:
+        return os.path.normpath(path)
+    return os.path.abspath(os.path.expanduser(path))
+
 class ExportCommands:
     """Handles export-related KiCAD operations"""
 
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
+        # Enabled (layer id, layer name) pairs, keyed by board identity
+        self._layer_cache: Dict[int, List[Tuple[int, str]]] = {}
+        # Enabled layer name -> layer id maps, keyed by board identity
+        self._layer_ids: Dict[int, Dict[str, int]] = {}
+        self._plotter: Optional[pcbnew.PLOT_CONTROLLER] = None
+        # Initial values of _PLOT_OPTIONS for the shared controller
+        self._plot_defaults: Dict[str, Any] = {}
         self.board = board
 
+    @property
+    def board(self) -> Optional[pcbnew.BOARD]:
+        return self._board
+
+    @board.setter
+    def board(self, board: Optional[pcbnew.BOARD]) -> None:
+        self._board = board
+        self._layer_cache.clear()
+        self._layer_ids.clear()
+        self._plotter = None
+
+    def invalidate_layer_cache(self) -> None:
+        """Drop cached layer data after the board may have been modified"""
+        self._layer_cache.clear()
+        self._layer_ids.clear()
+
+    def _configure_plot_opts(self, output_dir: str, plot_format: int) -> pcbnew.PLOT_CONTROLLER:
+        """Return the board's plot controller set up for output_dir and plot_format"""
+        # The controller is built once per board and shared by the exporters;
+        # options any exporter changes are put back to their initial values,
+        # so each export starts as if from a new controller
+        if self._plotter is None:
+            self._plotter = pcbnew.PLOT_CONTROLLER(self.board)
+            plot_opts = self._plotter.GetPlotOptions()
+            self._plot_defaults = {name: getattr(plot_opts, "Get" + name)() for name in _PLOT_OPTIONS}
+        else:
+            plot_opts = self._plotter.GetPlotOptions()
+            for name, value in self._plot_defaults.items():
+                getattr(plot_opts, "Set" + name)(value)
+        plot_opts.SetOutputDirectory(output_dir)
+        plot_opts.SetFormat(plot_format)
+        return self._plotter
+
+    def _plot_to_file(self, plotter: pcbnew.PLOT_CONTROLLER, output_path: str,
+                      plot_format: int, layers: List[Tuple[int, str]]) -> None:
+        """Plot layers into a single file and move it to output_path"""
+        name = os.path.splitext(os.path.basename(output_path))[0]
+        plotter.OpenPlotfile(name, plot_format, name)
+        for layer_id, _ in layers:
+            plotter.SetLayer(layer_id)
+            plotter.PlotLayer()
+        plotter.ClosePlot()
+        # The controller names the file after the board, so move it into place
+        os.replace(plotter.GetPlotFileName(), output_path)
+
+    def _enabled_layers(self) -> List[Tuple[int, str]]:
+        """Return (layer id, layer name) for every enabled layer of the board"""
+        key = id(self.board)
+        layers = self._layer_cache.get(key)
+        if layers is None:
+            # Walk only the enabled layer set instead of every possible layer ID
+            layers = [(layer_id, self.board.GetLayerName(layer_id))
+                      for layer_id in self.board.GetEnabledLayers().Seq()]
+            self._layer_cache[key] = layers
+        return layers
+
+    def _resolve_layers(self, layers: List[str]) -> List[Tuple[int, str]]:
+        """Return (layer id, layer name) for the named layers, or all enabled layers"""
+        if not layers:
+            return self._enabled_layers()
+        key = id(self.board)
+        layer_ids = self._layer_ids.get(key)
+        if layer_ids is None:
+            layer_ids = {layer_name: layer_id for layer_id, layer_name in self._enabled_layers()}
+            self._layer_ids[key] = layer_ids
+        resolved = []
+        for layer_name in layers:
+            layer_id = layer_ids.get(layer_name)
+            if layer_id is None:
+                # Names of disabled layers still go through the board lookup
+                layer_id = self.board.GetLayerID(layer_name)
+            if layer_id >= 0:
+                resolved.append((layer_id, layer_name))
+        return resolved
+
     def export_gerber(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Export Gerber files"""
         try:
@@ -42,35 +166,25 @@ class ExportCommands:
                 }
 
             # Create output directory if it doesn't exist
-            output_dir = os.path.abspath(os.path.expanduser(output_dir))
+            output_dir = _normalize_out_path(output_dir)
             os.makedirs(output_dir, exist_ok=True)
 
-            # Create plot controller
-            plotter = pcbnew.PLOT_CONTROLLER(self.board)
-            
             # Set up plot options
+            plotter = self._configure_plot_opts(output_dir, pcbnew.PLOT_FORMAT_GERBER)
             plot_opts = plotter.GetPlotOptions()
-            plot_opts.SetOutputDirectory(output_dir)
-            plot_opts.SetFormat(pcbnew.PLOT_FORMAT_GERBER)
             plot_opts.SetUseGerberProtelExtensions(use_protel_extensions)
             plot_opts.SetUseAuxOrigin(use_aux_origin)
             plot_opts.SetCreateGerberJobFile(generate_map_file)
             plot_opts.SetSubtractMaskFromSilk(True)
 
-            # Plot specified layers or all copper layers
+            # Plot specified layers or all enabled layers, one Gerber file each
             plotted_layers = []
-            if layers:
-                for layer_name in layers:
-                    layer_id = self.board.GetLayerID(layer_name)
-                    if layer_id >= 0:
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
-            else:
-                for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                    if self.board.IsLayerEnabled(layer_id):
-                        layer_name = self.board.GetLayerName(layer_id)
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
+            for layer_id, layer_name in self._resolve_layers(layers):
+                plotter.SetLayer(layer_id)
+                plotter.OpenPlotfile(layer_name.replace(".", "_"), pcbnew.PLOT_FORMAT_GERBER, layer_name)
+                plotter.PlotLayer()
+                plotter.ClosePlot()
+                plotted_layers.append(layer_name)
 
             # Generate drill files if requested
             drill_files = []
@@ -82,12 +196,19 @@ class ExportCommands:
                 merge_npth = False  # Keep plated/non-plated holes separate
                 drill_writer.SetOptions(merge_npth)
                 
+                # Snapshot existing drill files so stale ones from earlier runs
+                # are not reported; only drill-suffixed entries are stat'ed
+                with os.scandir(output_dir) as entries:
+                    existing = {entry.name: _file_key(entry) for entry in entries
+                                if entry.name.endswith(_DRILL_SUFFIXES)}
+
                 drill_writer.CreateDrillandMapFilesSet(output_dir, True, generate_map_file)
                 
-                # Get list of generated drill files
-                for file in os.listdir(output_dir):
-                    if file.endswith(".drl") or file.endswith(".cnc"):
-                        drill_files.append(file)
+                # Get list of new or rewritten drill files
+                with os.scandir(output_dir) as entries:
+                    drill_files = [entry.name for entry in entries
+                                   if entry.name.endswith(_DRILL_SUFFIXES)
+                                   and existing.get(entry.name) != _file_key(entry)]
 
             return {
                 "success": True,
@@ -132,16 +253,13 @@ class ExportCommands:
                 }
 
             # Create output directory if it doesn't exist
-            output_path = os.path.abspath(os.path.expanduser(output_path))
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            output_path = _normalize_out_path(output_path)
+            output_dir = os.path.dirname(output_path)
+            os.makedirs(output_dir, exist_ok=True)
 
-            # Create plot controller
-            plotter = pcbnew.PLOT_CONTROLLER(self.board)
-            
             # Set up plot options
+            plotter = self._configure_plot_opts(output_dir, pcbnew.PLOT_FORMAT_PDF)
             plot_opts = plotter.GetPlotOptions()
-            plot_opts.SetOutputDirectory(os.path.dirname(output_path))
-            plot_opts.SetFormat(pcbnew.PLOT_FORMAT_PDF)
             plot_opts.SetPlotFrameRef(frame_reference)
             plot_opts.SetPlotValue(True)
             plot_opts.SetPlotReference(True)
@@ -161,21 +279,14 @@ class ExportCommands:
             if page_size in page_sizes:
                 height, width = page_sizes[page_size]
                 plot_opts.SetPageSettings((width, height))
+                # Page settings cannot be read back to restore them, so the
+                # next export starts from a new controller
+                self._plotter = None
 
             # Plot specified layers or all enabled layers
-            plotted_layers = []
-            if layers:
-                for layer_name in layers:
-                    layer_id = self.board.GetLayerID(layer_name)
-                    if layer_id >= 0:
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
-            else:
-                for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                    if self.board.IsLayerEnabled(layer_id):
-                        layer_name = self.board.GetLayerName(layer_id)
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
+            plot_layers = self._resolve_layers(layers)
+            self._plot_to_file(plotter, output_path, pcbnew.PLOT_FORMAT_PDF, plot_layers)
+            plotted_layers = [layer_name for _, layer_name in plot_layers]
 
             return {
                 "success": True,
@@ -218,34 +329,21 @@ class ExportCommands:
                 }
 
             # Create output directory if it doesn't exist
-            output_path = os.path.abspath(os.path.expanduser(output_path))
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            output_path = _normalize_out_path(output_path)
+            output_dir = os.path.dirname(output_path)
+            os.makedirs(output_dir, exist_ok=True)
 
-            # Create plot controller
-            plotter = pcbnew.PLOT_CONTROLLER(self.board)
-            
             # Set up plot options
+            plotter = self._configure_plot_opts(output_dir, pcbnew.PLOT_FORMAT_SVG)
             plot_opts = plotter.GetPlotOptions()
-            plot_opts.SetOutputDirectory(os.path.dirname(output_path))
-            plot_opts.SetFormat(pcbnew.PLOT_FORMAT_SVG)
             plot_opts.SetPlotValue(include_components)
             plot_opts.SetPlotReference(include_components)
             plot_opts.SetMonochrome(black_and_white)
 
             # Plot specified layers or all enabled layers
-            plotted_layers = []
-            if layers:
-                for layer_name in layers:
-                    layer_id = self.board.GetLayerID(layer_name)
-                    if layer_id >= 0:
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
-            else:
-                for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                    if self.board.IsLayerEnabled(layer_id):
-                        layer_name = self.board.GetLayerName(layer_id)
-                        plotter.PlotLayer(layer_id)
-                        plotted_layers.append(layer_name)
+            plot_layers = self._resolve_layers(layers)
+            self._plot_to_file(plotter, output_path, pcbnew.PLOT_FORMAT_SVG, plot_layers)
+            plotted_layers = [layer_name for _, layer_name in plot_layers]
 
             return {
                 "success": True,
@@ -289,8 +387,9 @@ class ExportCommands:
                 }
 
             # Create output directory if it doesn't exist
-            output_path = os.path.abspath(os.path.expanduser(output_path))
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            output_path = _normalize_out_path(output_path)
+            output_dir = os.path.dirname(output_path)
+            os.makedirs(output_dir, exist_ok=True)
 
             # Get 3D viewer
             viewer = self.board.Get3DViewer()
@@ -359,42 +458,51 @@ class ExportCommands:
                 }
 
             # Create output directory if it doesn't exist
-            output_path = os.path.abspath(os.path.expanduser(output_path))
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # Get all components
-            components = []
-            for module in self.board.GetFootprints():
-                component = {
-                    "reference": module.GetReference(),
-                    "value": module.GetValue(),
-                    "footprint": module.GetFootprintName(),
-                    "layer": self.board.GetLayerName(module.GetLayer())
-                }
-
-                # Add requested attributes
-                for attr in include_attributes:
-                    if hasattr(module, f"Get{attr}"):
-                        component[attr] = getattr(module, f"Get{attr}")()
-
-                components.append(component)
+            output_path = _normalize_out_path(output_path)
+            output_dir = os.path.dirname(output_path)
+            os.makedirs(output_dir, exist_ok=True)
 
-            # Group by value if requested
             if group_by_value:
-                grouped = {}
-                for comp in components:
-                    key = f"{comp['value']}_{comp['footprint']}"
-                    if key not in grouped:
-                        grouped[key] = {
-                            "value": comp["value"],
-                            "footprint": comp["footprint"],
+                # Group by value and footprint in a single pass over the footprints
+                grouped: Dict[Tuple[str, str], Dict[str, Any]] = {}
+                for module in self.board.GetFootprints():
+                    value = module.GetValue()
+                    footprint = module.GetFootprintName()
+                    group = grouped.get((value, footprint))
+                    if group is None:
+                        grouped[(value, footprint)] = {
+                            "value": value,
+                            "footprint": footprint,
                             "quantity": 1,
-                            "references": [comp["reference"]]
+                            "references": [module.GetReference()]
                         }
                     else:
-                        grouped[key]["quantity"] += 1
-                        grouped[key]["references"].append(comp["reference"])
+                        group["quantity"] += 1
+                        group["references"].append(module.GetReference())
                 components = list(grouped.values())
+            else:
+                # Get all components
+                get_layer_name = self.board.GetLayerName
+                # Resolve attribute getters once on the footprint class
+                # rather than reflecting on every footprint
+                attr_getters = [(attr, getter) for attr, getter in
+                                ((attr, getattr(pcbnew.FOOTPRINT, f"Get{attr}", None))
+                                 for attr in include_attributes)
+                                if callable(getter)]
+                components = []
+                for module in self.board.GetFootprints():
+                    component = {
+                        "reference": module.GetReference(),
+                        "value": module.GetValue(),
+                        "footprint": module.GetFootprintName(),
+                        "layer": get_layer_name(module.GetLayer())
+                    }
+
+                    # Add requested attributes
+                    for attr, getter in attr_getters:
+                        component[attr] = getter(module)
+
+                    components.append(component)
 
             # Export based on format
             if format == "CSV":
@@ -432,44 +540,50 @@ class ExportCommands:
 
     def _export_bom_csv(self, path: str, components: List[Dict[str, Any]]) -> None:
         """Export BOM to CSV format"""
-        import csv
+        fieldnames = list(components[0].keys())
+        # Every row shares the header's keys, so pull values positionally
+        row_values = operator.itemgetter(*fieldnames)
         with open(path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=components[0].keys())
-            writer.writeheader()
-            writer.writerows(components)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(row_values, components))
 
     def _export_bom_xml(self, path: str, components: List[Dict[str, Any]]) -> None:
         """Export BOM to XML format"""
-        import xml.etree.ElementTree as ET
-        root = ET.Element("bom")
-        for comp in components:
-            comp_elem = ET.SubElement(root, "component")
-            for key, value in comp.items():
-                elem = ET.SubElement(comp_elem, key)
-                elem.text = str(value)
-        tree = ET.ElementTree(root)
-        tree.write(path, encoding='utf-8', xml_declaration=True)
+        # Elements are streamed to the file as they are produced, with no DOM built
+        with open(path, 'w', encoding='utf-8') as f:
+            xml = XMLGenerator(f, encoding='utf-8', short_empty_elements=True)
+            xml.startDocument()
+            xml.startElement("bom", {})
+            for comp in components:
+                xml.startElement("component", {})
+                for key, value in comp.items():
+                    xml.startElement(key, {})
+                    xml.characters(str(value))
+                    xml.endElement(key)
+                xml.endElement("component")
+            xml.endElement("bom")
+            xml.endDocument()
 
     def _export_bom_html(self, path: str, components: List[Dict[str, Any]]) -> None:
         """Export BOM to HTML format"""
-        html = ["<html><head><title>Bill of Materials</title></head><body>"]
-        html.append("<table border='1'><tr>")
-        # Headers
-        for key in components[0].keys():
-            html.append(f"<th>{key}</th>")
-        html.append("</tr>")
-        # Data
-        for comp in components:
-            html.append("<tr>")
-            for value in comp.values():
-                html.append(f"<td>{value}</td>")
-            html.append("</tr>")
-        html.append("</table></body></html>")
+        header = "".join("<th>%s</th>\n" % str(key).translate(_HTML_ESCAPES) for key in components[0])
+        # Each row is formatted in one join; writelines streams them without a list
+        rows = ("<tr>\n" + "".join("<td>%s</td>\n" % str(value).translate(_HTML_ESCAPES)
+                                     for value in comp.values()) + "</tr>\n"
+                for comp in components)
         with open(path, 'w') as f:
-            f.write("\n".join(html))
+            f.write("<html><head><title>Bill of Materials</title></head><body>\n"
+                    "<table border='1'><tr>\n" + header + "</tr>\n")
+            f.writelines(rows)
+            f.write("</table></body></html>")
 
     def _export_bom_json(self, path: str, components: List[Dict[str, Any]]) -> None:
         """Export BOM to JSON format"""
-        import json
+        if orjson is not None:
+            # orjson writes the compact document straight to UTF-8 bytes
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps({"components": components}))
+            return
         with open(path, 'w') as f:
-            json.dump({"components": components}, f, indent=2)
+            json.dump({"components": components}, f, separators=(',', ':'))
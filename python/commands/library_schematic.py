@@ -1,7 +1,134 @@
 from skip import Schematic
 # Symbol class might not be directly importable in the current version
 import os
+import re
 import glob
+import mmap
+import logging
+import itertools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('kicad_interface')
+
+# Suffix of KiCAD symbol library files
+_SYM_SUFFIX = ".kicad_sym"
+
+def _scan_kicad_syms(directory):
+    """List the .kicad_sym files directly inside a directory"""
+    try:
+        with os.scandir(directory) as entries:
+            # DirEntry caches the file type from the directory read, so no
+            # extra stat is needed per entry; hidden files are skipped like glob does
+            return [os.path.join(directory, entry.name) for entry in entries
+                    if entry.name.endswith(_SYM_SUFFIX) and not entry.name.startswith(".")
+                    and entry.is_file()]
+    except OSError:
+        return []
+
+# list_available_libraries results keyed by search paths, as
+# (watched directories, their mtimes, result)
+_LIB_CACHE = {}
+
+def _static_root(path_pattern):
+    """Return the leading directory of a pattern that contains no wildcards"""
+    root = os.path.dirname(path_pattern)
+    while glob.has_magic(root):
+        root = os.path.dirname(root)
+    return root
+
+def _dir_mtimes(directories):
+    """Return the mtime of each directory, None for missing ones"""
+    mtimes = []
+    for directory in directories:
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def _glob_library_pattern(path_pattern):
+    """Glob one library path pattern, returning (matches, directories searched)"""
+    try:
+        directory, name = os.path.split(path_pattern)
+        if name == "*" + _SYM_SUFFIX and "**" not in directory:
+            # The common "<dir>/*.kicad_sym" form is listed with scandir instead
+            # of fnmatch-ing every entry; only wildcard directories are globbed
+            directories = glob.glob(directory) if glob.has_magic(directory) else [directory]
+            return [path for d in directories for path in _scan_kicad_syms(d)], directories
+        # Use glob to find all matching files
+        matches = glob.glob(path_pattern, recursive=True)
+        return matches, {os.path.dirname(path) for path in matches}
+    except Exception as e:
+        logger.warning("Error searching for libraries at %s: %s", path_pattern, e)
+        return [], ()
+
+# Common mappings from component type to library/symbol
+_COMMON_MAPPINGS = {
+    "resistor": {"library": "Device", "symbol": "R"},
+    "capacitor": {"library": "Device", "symbol": "C"},
+    "inductor": {"library": "Device", "symbol": "L"},
+    "diode": {"library": "Device", "symbol": "D"},
+    "led": {"library": "Device", "symbol": "LED"},
+    "transistor_npn": {"library": "Device", "symbol": "Q_NPN_BCE"},
+    "transistor_pnp": {"library": "Device", "symbol": "Q_PNP_BCE"},
+    "opamp": {"library": "Amplifier_Operational", "symbol": "OpAmp_Dual_Generic"},
+    "microcontroller": {"library": "MCU_Module", "symbol": "Arduino_UNO_R3"},
+    # Add more common components as needed
+}
+
+# Mappings ordered longest key first so partial matches prefer the most
+# specific type rather than whichever key happens to come first
+_MAPPINGS_BY_SPECIFICITY = sorted(_COMMON_MAPPINGS.items(), key=lambda item: -len(item[0]))
+
+# Symbol headers and the fields read from .kicad_sym S-expressions; the
+# library files are scanned as bytes rather than parsed into a tree
+_SYMBOL_RE = re.compile(rb'\(symbol\s+"((?:[^"\\]|\\.)*)"')
+_SEXPR_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[()]')
+_PROPERTY_RE = re.compile(rb'\(property\s+"((?:[^"\\]|\\.)*)"\s+"((?:[^"\\]|\\.)*)"')
+_EXTENDS_RE = re.compile(rb'\(extends\s+"((?:[^"\\]|\\.)*)"')
+# Pins are counted by number: units and alternate body styles repeat them
+_PIN_NUMBER_RE = re.compile(rb'\(number\s+"((?:[^"\\]|\\.)*)"')
+
+# Units of a symbol are nested symbols named <parent>_<unit>_<style>
+_UNIT_SUFFIX_RE = re.compile(r'_\d+_\d+')
+
+@contextlib.contextmanager
+def _map_library(library_path):
+    """Map a library file read-only, yielding its bytes"""
+    with open(library_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+def _iter_symbol_names(data):
+    """Yield the names of the top-level symbols in library bytes"""
+    parent = None
+    for match in _SYMBOL_RE.finditer(data):
+        name = match.group(1).decode('utf-8')
+        if parent is not None and name.startswith(parent) and _UNIT_SUFFIX_RE.fullmatch(name, len(parent)):
+            continue
+        parent = name
+        yield name
+
+def _symbol_header_re(name):
+    """Return a pattern matching the header of the symbol called name"""
+    return re.compile(rb'\(symbol\s+"' + re.escape(name) + rb'"')
+
+def _symbol_block(data, start):
+    """Return the balanced S-expression starting at start"""
+    depth = 0
+    for token in _SEXPR_TOKEN_RE.finditer(data, start):
+        if token.group() == b"(":
+            depth += 1
+        elif token.group() == b")":
+            depth -= 1
+            if depth == 0:
+                return data[start:token.end()]
+    return data[start:]
 
 class LibraryManager:
     """Manage symbol libraries"""
@@ -19,69 +146,106 @@ class LibraryManager:
                 os.path.expanduser("~/Documents/KiCad/*/symbols/*.kicad_sym")  # User libraries pattern
             ]
 
+        # Reuse the previous scan while none of the directories it covered
+        # has had entries added or removed
+        cache_key = tuple(search_paths)
+        cached = _LIB_CACHE.get(cache_key)
+        if cached is not None and _dir_mtimes(cached[0]) == cached[1]:
+            # Callers get their own lists, so the cached scan cannot be changed
+            return {key: list(value) for key, value in cached[2].items()}
+
         libraries = []
-        for path_pattern in search_paths:
-            try:
-                # Use glob to find all matching files
-                matching_libs = glob.glob(path_pattern, recursive=True)
-                libraries.extend(matching_libs)
-            except Exception as e:
-                print(f"Error searching for libraries at {path_pattern}: {e}")
+        watched = {_static_root(p) for p in search_paths}
+        if search_paths:
+            # The globs are filesystem-bound, so run them concurrently
+            with ThreadPoolExecutor(max_workers=len(search_paths)) as executor:
+                for matching_libs, searched_dirs in executor.map(_glob_library_pattern, search_paths):
+                    libraries.extend(matching_libs)
+                    watched.update(searched_dirs)
 
         # Extract library names from paths
         library_names = [os.path.splitext(os.path.basename(lib))[0] for lib in libraries]
-        print(f"Found {len(library_names)} libraries: {', '.join(library_names[:10])}{'...' if len(library_names) > 10 else ''}")
+        # The name preview is only formatted when it will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Found %d libraries: %s%s", len(library_names),
+                        ', '.join(itertools.islice(library_names, 10)),
+                        '...' if len(library_names) > 10 else '')
         
+        # The cache keeps its own immutable copy of the scan
+        watched = tuple(sorted(watched))
+        _LIB_CACHE[cache_key] = (watched, _dir_mtimes(watched),
+                                 {"paths": tuple(libraries), "names": tuple(library_names)})
+
         # Return both full paths and library names
         return {"paths": libraries, "names": library_names}
 
+    @staticmethod
+    def iter_available_libraries(search_paths=None):
+        """Yield (path, name) for each available symbol library"""
+        libraries = LibraryManager.list_available_libraries(search_paths)
+        return zip(libraries["paths"], libraries["names"])
+
     @staticmethod
     def list_library_symbols(library_path):
         """List all symbols in a library"""
         try:
-            # kicad-skip doesn't provide a direct way to simply list symbols in a library
-            # without loading each one. We might need to implement this using KiCAD's Python API
-            # directly, or by using a different approach.
-            # For now, this is a placeholder implementation.
-            
-            # A potential approach would be to load the library file using KiCAD's Python API
-            # or by parsing the library file format.
-            # KiCAD symbol libraries are .kicad_sym files which are S-expression format
-            print(f"Attempted to list symbols in library {library_path}. This requires advanced implementation.")
-            return []
+            # KiCAD symbol libraries are .kicad_sym files which are S-expression format;
+            # listing only needs the symbol headers, so the file is scanned in place
+            with _map_library(library_path) as data:
+                return list(_iter_symbol_names(data))
         except Exception as e:
-            print(f"Error listing symbols in library {library_path}: {e}")
+            logger.warning("Error listing symbols in library %s: %s", library_path, e)
             return []
 
     @staticmethod
     def get_symbol_details(library_path, symbol_name):
         """Get detailed information about a symbol"""
         try:
-            # Similar to list_library_symbols, this might require a more direct approach
-            # using KiCAD's Python API or by parsing the symbol library.
-            print(f"Attempted to get details for symbol {symbol_name} in library {library_path}. This requires advanced implementation.")
-            return {}
+            header = _symbol_header_re(symbol_name.encode('utf-8'))
+            with _map_library(library_path) as data:
+                match = header.search(data)
+                if match is None:
+                    return {}
+                # Only the symbol's own block is copied out of the file
+                block = _symbol_block(data, match.start())
+
+            extends = _EXTENDS_RE.search(block)
+            return {
+                "name": symbol_name,
+                "library": os.path.splitext(os.path.basename(library_path))[0],
+                "extends": extends.group(1).decode('utf-8') if extends else None,
+                "properties": {key.decode('utf-8'): value.decode('utf-8')
+                               for key, value in _PROPERTY_RE.findall(block)},
+                "pinCount": len(set(_PIN_NUMBER_RE.findall(block)))
+            }
         except Exception as e:
-            print(f"Error getting symbol details for {symbol_name} in {library_path}: {e}")
+            logger.warning("Error getting symbol details for %s in %s: %s", symbol_name, library_path, e)
             return {}
 
     @staticmethod
     def search_symbols(query, search_paths=None):
         """Search for symbols matching criteria"""
         try:
-            # This would typically involve:
-            # 1. Getting a list of all libraries using list_available_libraries
-            # 2. For each library, getting a list of all symbols
-            # 3. Filtering symbols based on the query
-            
-            # For now, this is a placeholder implementation
-            libraries = LibraryManager.list_available_libraries(search_paths)
-            
+            # Each library is scanned in place in one forward pass over its
+            # symbol headers, which also skips units of the preceding symbol
+            query = query.lower()
+
             results = []
-            print(f"Searched for symbols matching '{query}'. This requires advanced implementation.")
+            for library_path, library_name in LibraryManager.iter_available_libraries(search_paths):
+                try:
+                    with _map_library(library_path) as data:
+                        for name in _iter_symbol_names(data):
+                            if query in name.lower():
+                                results.append({
+                                    "name": name,
+                                    "library": library_name,
+                                    "path": library_path
+                                })
+                except OSError as e:
+                    logger.warning("Error reading library %s: %s", library_path, e)
             return results
         except Exception as e:
-            print(f"Error searching for symbols matching '{query}': {e}")
+            logger.warning("Error searching for symbols matching '%s': %s", query, e)
             return []
             
     @staticmethod
@@ -90,31 +254,18 @@ class LibraryManager:
         # This method provides a simplified way to get a symbol for common component types
         # It's useful when the user doesn't specify a particular library/symbol
         
-        # Define common mappings from component type to library/symbol
-        common_mappings = {
-            "resistor": {"library": "Device", "symbol": "R"},
-            "capacitor": {"library": "Device", "symbol": "C"},
-            "inductor": {"library": "Device", "symbol": "L"},
-            "diode": {"library": "Device", "symbol": "D"},
-            "led": {"library": "Device", "symbol": "LED"},
-            "transistor_npn": {"library": "Device", "symbol": "Q_NPN_BCE"},
-            "transistor_pnp": {"library": "Device", "symbol": "Q_PNP_BCE"},
-            "opamp": {"library": "Amplifier_Operational", "symbol": "OpAmp_Dual_Generic"},
-            "microcontroller": {"library": "MCU_Module", "symbol": "Arduino_UNO_R3"},
-            # Add more common components as needed
-        }
-        
         # Normalize input to lowercase
         component_type_lower = component_type.lower()
         
         # Try direct match first
-        if component_type_lower in common_mappings:
-            return common_mappings[component_type_lower]
+        # Copies are returned so callers cannot modify the shared table
+        if component_type_lower in _COMMON_MAPPINGS:
+            return dict(_COMMON_MAPPINGS[component_type_lower])
             
-        # Try partial matches
-        for key, value in common_mappings.items():
+        # Try partial matches, most specific key first
+        for key, value in _MAPPINGS_BY_SPECIFICITY:
             if component_type_lower in key or key in component_type_lower:
-                return value
+                return dict(value)
                 
         # Default fallback
         return {"library": "Device", "symbol": "R"}
@@ -3,19 +3,375 @@ Project-related command implementations for KiCAD interface
 """
 
 import os
+import re
+import json
+import mmap
+import queue
+import atexit
+import threading
 import pcbnew  # type: ignore
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+# orjson is faster at project file serialization; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger('kicad_interface')
 
+def _err(message: str, e: Exception) -> Dict[str, Any]:
+    """Build the failure response for an exception"""
+    return {"success": False, "message": message, "errorDetails": str(e)}
+
+# Project and board file suffixes
+_PRO_SUFFIX = ".kicad_pro"
+_PCB_SUFFIX = ".kicad_pcb"
+
+# Home directory, resolved once for expanding "~/..." paths
+_HOME = os.path.expanduser("~")
+_SEPARATORS = os.sep + (os.altsep or "")
+
+def _expand(path: str) -> str:
+    """Expand a leading ~ like os.path.expanduser"""
+    if not path.startswith("~"):
+        return path
+    if path == "~" or path[1] in _SEPARATORS:
+        return _HOME + path[1:]
+    # ~user forms still need the password database
+    return os.path.expanduser(path)
+
+# Loaded boards keyed by (board path, mtime_ns, size); an entry is dropped
+# as soon as its board is modified in memory
+_BOARD_CACHE: "OrderedDict[Tuple[str, int, int], pcbnew.BOARD]" = OrderedDict()
+_BOARD_CACHE_SIZE = 4
+
+def _board_file_key(board_path: str) -> Tuple[str, int, int]:
+    """Return the cache key identifying the current contents of a board file"""
+    st = os.stat(board_path)
+    return (board_path, st.st_mtime_ns, st.st_size)
+
+def _cache_board(board_path: str, board: pcbnew.BOARD) -> None:
+    """Store a board as the loaded form of board_path's current contents"""
+    _evict_board(board)
+    _BOARD_CACHE[_board_file_key(board_path)] = board
+    if len(_BOARD_CACHE) > _BOARD_CACHE_SIZE:
+        _BOARD_CACHE.popitem(last=False)
+
+def _evict_board(board: pcbnew.BOARD) -> None:
+    """Drop any cache entries holding board"""
+    for key in [key for key, cached in _BOARD_CACHE.items() if cached is board]:
+        del _BOARD_CACHE[key]
+
+# Bytes read from the start of a board file when looking for its title block
+_HEADER_READ_SIZE = 8192
+
+# Title block fields in a .kicad_pcb header; values are quoted, or bare
+# words in older files
+_TITLE_BLOCK_FIELD_RE = re.compile(
+    r'\((title|date|rev|company|comment\s+\d+)\s+(?:"((?:[^"\\]|\\.)*)"|([^\s()]+))\)')
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+# C-style escapes in quoted strings; any other escaped character stands for itself
+_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+def _unescape(value: str) -> str:
+    """Decode the backslash escapes in a quoted s-expression string"""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+# Title block field names to get_project_info keys
+_TITLE_BLOCK_KEYS = {
+    "title": "title",
+    "date": "date",
+    "rev": "revision",
+    "company": "company",
+    "comment 1": "comment1",
+    "comment 2": "comment2",
+    "comment 3": "comment3",
+    "comment 4": "comment4"
+}
+
+# get_project_info keys for title block comments 0-3
+_COMMENT_KEYS = ("comment1", "comment2", "comment3", "comment4")
+
+# Background saves: the newest board queued per path, written by one worker
+# thread; the board is only used again once the write has been waited for
+_save_lock = threading.Lock()
+_pending_saves: Dict[str, pcbnew.BOARD] = {}
+# Boards written by the worker, cached on the main thread once waited for
+_saved_boards: List[Tuple[str, pcbnew.BOARD]] = []
+# Boards whose background save failed, so they still differ from their file
+_failed_saves: List[pcbnew.BOARD] = []
+_save_queue: "queue.Queue[str]" = queue.Queue()
+_saves_idle = threading.Event()
+_saves_idle.set()
+_save_worker: Optional[threading.Thread] = None
+
+def _save_board_file(board_path: str, board: pcbnew.BOARD) -> None:
+    """Save a board through a temporary file replaced onto board_path
+
+    An interrupted write never leaves a truncated board file behind.
+    """
+    directory, base = os.path.split(board_path)
+    tmp_path = os.path.join(directory, f".{os.path.splitext(base)[0]}.{os.getpid()}.saving{_PCB_SUFFIX}")
+    # SaveBoard also writes a project file next to the board it is given
+    tmp_pro = tmp_path[:-len(_PCB_SUFFIX)] + _PRO_SUFFIX
+    try:
+        pcbnew.SaveBoard(tmp_path, board)
+        os.replace(tmp_path, board_path)
+        if os.path.exists(tmp_pro):
+            os.replace(tmp_pro, os.path.splitext(board_path)[0] + _PRO_SUFFIX)
+    finally:
+        for path in (tmp_path, tmp_pro):
+            if os.path.exists(path):
+                os.remove(path)
+        board.SetFileName(board_path)
+
+def _run_save_worker() -> None:
+    """Write queued boards until the process exits"""
+    while True:
+        board_path = _save_queue.get()
+        with _save_lock:
+            board = _pending_saves.pop(board_path, None)
+        if board is not None:
+            try:
+                _save_board_file(board_path, board)
+                logger.info(f"Saved project in background to: {board_path}")
+                with _save_lock:
+                    _saved_boards.append((board_path, board))
+            except Exception as e:
+                logger.error("Error saving project in background: %s", e)
+                with _save_lock:
+                    _failed_saves.append(board)
+        with _save_lock:
+            if not _pending_saves:
+                _saves_idle.set()
+
+def _queue_save(board_path: str, board: pcbnew.BOARD) -> None:
+    """Queue a board to be saved by the background worker"""
+    global _save_worker
+    with _save_lock:
+        # A save already queued for this path picks up the newer board
+        queued = board_path in _pending_saves
+        _pending_saves[board_path] = board
+        _saves_idle.clear()
+    if not queued:
+        _save_queue.put(board_path)
+    if _save_worker is None:
+        _save_worker = threading.Thread(target=_run_save_worker, name="kicad-save", daemon=True)
+        _save_worker.start()
+
+def wait_for_pending_saves() -> None:
+    """Block until every queued background save has been written"""
+    _saves_idle.wait()
+    # The board cache is only touched from the main thread
+    with _save_lock:
+        saved = _saved_boards[:]
+        del _saved_boards[:]
+    for board_path, board in saved:
+        _cache_board(board_path, board)
+
+def _take_save_failure(board: Any) -> bool:
+    """Return whether a background save of board failed, forgetting the failure"""
+    with _save_lock:
+        remaining = [b for b in _failed_saves if b is not board]
+        failed = len(remaining) != len(_failed_saves)
+        _failed_saves[:] = remaining
+    return failed
+
+# Queued saves must not be lost when the interface exits; the interface
+# also waits for them on SIGTERM and when its input closes
+atexit.register(wait_for_pending_saves)
+
+# Every .kicad_pcb board file starts with this token
+_PCB_MAGIC = b"(kicad_pcb"
+
+def _check_board_file(board_path: str) -> None:
+    """Raise unless board_path looks like a board file, without parsing it"""
+    if not os.path.isfile(board_path):
+        raise FileNotFoundError(f"Board file not found: {board_path}")
+    # Other formats LoadBoard reads, e.g. legacy .brd boards, are only checked
+    # for being readable and left to LoadBoard to validate
+    if not board_path.endswith(_PCB_SUFFIX):
+        if not os.access(board_path, os.R_OK):
+            raise PermissionError(f"Board file is not readable: {board_path}")
+        return
+    with open(board_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Board file is empty: {board_path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not mm[:64].lstrip().startswith(_PCB_MAGIC):
+                raise ValueError(f"Not a KiCAD board file: {board_path}")
+
+def _read_titleblock_fast(board_path: str) -> Optional[Dict[str, str]]:
+    """Read the title block from the head of a board file without parsing the board
+
+    Returns None when the header is not in the expected form.
+    """
+    with open(board_path, 'rb') as f:
+        header = f.read(_HEADER_READ_SIZE).decode('utf-8', errors='replace')
+    info = dict.fromkeys(_TITLE_BLOCK_KEYS.values(), "")
+    start = header.find("(title_block")
+    if start < 0:
+        # Boards with an empty title block omit it; the layer table follows
+        # the header, so seeing it means there is no title block
+        return info if "(layers" in header else None
+    end = header.find("(layers", start)
+    if end < 0:
+        return None
+    for field, quoted, bare in _TITLE_BLOCK_FIELD_RE.findall(header, start, end):
+        key = _TITLE_BLOCK_KEYS.get(" ".join(field.split()))
+        if key:
+            info[key] = _unescape(quoted) if bare == "" else bare
+    return info
+
+def _load_board(board_path: str) -> pcbnew.BOARD:
+    """Load a board file, reusing an unmodified board loaded from the same contents"""
+    cache_key = _board_file_key(board_path)
+    board = _BOARD_CACHE.get(cache_key)
+    if board is None:
+        board = pcbnew.LoadBoard(board_path)
+        _cache_board(board_path, board)
+    else:
+        _BOARD_CACHE.move_to_end(cache_key)
+    return board
+
+class _LazyBoard:
+    """Board file that is only parsed when one of its methods is used"""
+
+    __slots__ = ("_board_path", "_board")
+
+    def __init__(self, board_path: str):
+        self._board_path = board_path
+        self._board: Optional[pcbnew.BOARD] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._board is not None
+
+    def load(self) -> pcbnew.BOARD:
+        """Return the board, loading it on first use"""
+        if self._board is None:
+            self._board = _load_board(self._board_path)
+        return self._board
+
+    def GetFileName(self) -> str:
+        # Known without loading the board
+        return self._board_path
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
 class ProjectCommands:
     """Handles project-related KiCAD operations"""
 
+    __slots__ = ("_board", "_tracked", "_dirty")
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
+        self._board = None
         self.board = board
 
+    @property
+    def board(self) -> Optional[pcbnew.BOARD]:
+        return self._board
+
+    @board.setter
+    def board(self, board: Optional[pcbnew.BOARD]) -> None:
+        # Edits made outside these commands (e.g. in the editor) are not
+        # seen, so a board handed in from outside is always saved
+        if board is not self._board:
+            self._board = board
+            self._tracked = False
+            self._dirty = True
+
+    def _set_project_board(self, board: pcbnew.BOARD) -> None:
+        """Use a board that matches its file, tracking edits from here on"""
+        self._board = board
+        self._tracked = True
+        self._dirty = False
+
+    def load_board(self) -> Optional[pcbnew.BOARD]:
+        """Return the project's board, loading it if opening was deferred"""
+        if isinstance(self._board, _LazyBoard):
+            self._board = self._board.load()
+        return self._board
+
+    def mark_board_modified(self) -> None:
+        """Note that the loaded board was edited and no longer matches its file"""
+        board = self.board
+        if isinstance(board, _LazyBoard):
+            if not board.loaded:
+                return
+            board = board.load()
+        if board is not None:
+            self._dirty = True
+            _evict_board(board)
+
+    def _create_project_files(self, project_name: str, path: str, template: Optional[str],
+                              current_date: str, created_dirs: Set[str]) -> Tuple[Dict[str, Any], pcbnew.BOARD]:
+        """Create and save one project's board and project file"""
+        # Generate the full project path, adding the suffix to the short name
+        file_name = project_name if project_name.endswith(_PRO_SUFFIX) else project_name + _PRO_SUFFIX
+        project_path = os.path.join(path, file_name)
+
+        # Create project directory if it doesn't exist; that is path itself
+        # unless the name has directory parts
+        if any(sep in file_name for sep in _SEPARATORS):
+            project_dir = os.path.dirname(project_path)
+        else:
+            project_dir = path
+        if project_dir not in created_dirs:
+            os.makedirs(project_dir, exist_ok=True)
+            created_dirs.add(project_dir)
+
+        # Create a new board
+        board = pcbnew.BOARD()
+        
+        # Set project properties and the current date on one title block
+        title_block = board.GetTitleBlock()
+        title_block.SetTitle(project_name)
+        title_block.SetDate(current_date)
+
+        # If template is specified, try to load it
+        if template:
+            template_path = _expand(template)
+            if os.path.exists(template_path):
+                # Templates are only read, so an unchanged template is loaded
+                # once and reused from the board cache
+                template_board = _load_board(template_path)
+                # Copy settings from template
+                board.SetDesignSettings(template_board.GetDesignSettings())
+                board.SetLayerStack(template_board.GetLayerStack())
+
+        # Save the board
+        board_path = project_path[:-len(_PRO_SUFFIX)] + _PCB_SUFFIX
+        board.SetFileName(board_path)
+        pcbnew.SaveBoard(board_path, board)
+
+        # Create project file; json escapes the board file name
+        project_data = {"board": {"filename": os.path.basename(board_path)}}
+        if orjson is not None:
+            payload = orjson.dumps(project_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = (json.dumps(project_data, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+        # One unbuffered write; the payload is only a few dozen bytes
+        fd = os.open(project_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+        return {
+            "name": project_name,
+            "path": project_path,
+            "boardPath": board_path
+        }, board
+
     def create_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new KiCAD project"""
         try:
@@ -23,67 +379,64 @@ class ProjectCommands:
             path = params.get("path", os.getcwd())
             template = params.get("template")
 
-            # Generate the full project path
-            project_path = os.path.join(path, project_name)
-            if not project_path.endswith(".kicad_pro"):
-                project_path += ".kicad_pro"
-
-            # Create project directory if it doesn't exist
-            os.makedirs(os.path.dirname(project_path), exist_ok=True)
-
-            # Create a new board
-            board = pcbnew.BOARD()
-            
-            # Set project properties
-            board.GetTitleBlock().SetTitle(project_name)
-            
-            # Set current date with proper parameter
-            from datetime import datetime
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            board.GetTitleBlock().SetDate(current_date)
-
-            # If template is specified, try to load it
-            if template:
-                template_path = os.path.expanduser(template)
-                if os.path.exists(template_path):
-                    template_board = pcbnew.LoadBoard(template_path)
-                    # Copy settings from template
-                    board.SetDesignSettings(template_board.GetDesignSettings())
-                    board.SetLayerStack(template_board.GetLayerStack())
-
-            # Save the board
-            board_path = project_path.replace(".kicad_pro", ".kicad_pcb")
-            board.SetFileName(board_path)
-            pcbnew.SaveBoard(board_path, board)
-
-            # Create project file
-            with open(project_path, 'w') as f:
-                f.write('{\n')
-                f.write('  "board": {\n')
-                f.write(f'    "filename": "{os.path.basename(board_path)}"\n')
-                f.write('  }\n')
-                f.write('}\n')
-
-            self.board = board
+            current_date = datetime.now().date().isoformat()
+
+            project, board = self._create_project_files(project_name, path, template, current_date, set())
+            self._set_project_board(board)
 
             return {
                 "success": True,
                 "message": f"Created project: {project_name}",
-                "project": {
-                    "name": project_name,
-                    "path": project_path,
-                    "boardPath": board_path
-                }
+                "project": project
             }
 
         except Exception as e:
-            logger.error(f"Error creating project: {str(e)}")
+            logger.error("Error creating project: %s", e)
+            return _err("Failed to create project", e)
+
+    def create_projects(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create several KiCAD projects in one call"""
+        try:
+            projects = params.get("projects")
+            if not projects:
+                return {
+                    "success": False,
+                    "message": "No projects provided",
+                    "errorDetails": "The projects parameter is required"
+                }
+
+            # Shared across the batch: one timestamp, and each directory created once
+            current_date = datetime.now().date().isoformat()
+            created_dirs: Set[str] = set()
+            default_path = os.getcwd()
+
+            results = []
+            created = 0
+            for spec in projects:
+                project_name = spec.get("projectName", "New_Project")
+                try:
+                    project, board = self._create_project_files(
+                        project_name, spec.get("path", default_path), spec.get("template"),
+                        current_date, created_dirs)
+                except Exception as e:
+                    logger.error("Error creating project %s: %s", project_name, e)
+                    results.append(_err(f"Failed to create project: {project_name}", e))
+                    continue
+                # The last project created becomes the current board
+                self._set_project_board(board)
+                created += 1
+                results.append({"success": True, "project": project})
+
             return {
-                "success": False,
-                "message": "Failed to create project",
-                "errorDetails": str(e)
+                "success": created > 0,
+                "message": f"Created {created} of {len(projects)} projects",
+                "projects": results
             }
 
+        except Exception as e:
+            logger.error("Error creating projects: %s", e)
+            return _err("Failed to create projects", e)
+
     def open_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Open an existing KiCAD project"""
         try:
@@ -96,35 +449,35 @@ class ProjectCommands:
                 }
 
             # Expand user path and make absolute
-            filename = os.path.abspath(os.path.expanduser(filename))
+            filename = os.path.abspath(_expand(filename))
 
             # If it's a project file, get the board file
-            if filename.endswith(".kicad_pro"):
-                board_path = filename.replace(".kicad_pro", ".kicad_pcb")
+            # Only the suffix is swapped; replace() would also rewrite a
+            # ".kicad_pro" appearing elsewhere in the path
+            if filename.endswith(_PRO_SUFFIX):
+                board_path = filename[:-len(_PRO_SUFFIX)] + _PCB_SUFFIX
             else:
                 board_path = filename
 
-            # Load the board
-            board = pcbnew.LoadBoard(board_path)
-            self.board = board
+            # The board is parsed on first use; only check its header now so
+            # a missing or invalid file fails here rather than on first use
+            _check_board_file(board_path)
+            self._set_project_board(_LazyBoard(board_path))
+            board_base = os.path.basename(board_path)
 
             return {
                 "success": True,
-                "message": f"Opened project: {os.path.basename(board_path)}",
+                "message": f"Opened project: {board_base}",
                 "project": {
-                    "name": os.path.splitext(os.path.basename(board_path))[0],
+                    "name": os.path.splitext(board_base)[0],
                     "path": filename,
                     "boardPath": board_path
                 }
             }
 
         except Exception as e:
-            logger.error(f"Error opening project: {str(e)}")
-            return {
-                "success": False,
-                "message": "Failed to open project",
-                "errorDetails": str(e)
-            }
+            logger.error("Error opening project: %s", e)
+            return _err("Failed to open project", e)
 
     def save_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Save the current KiCAD project"""
@@ -136,31 +489,72 @@ class ProjectCommands:
                     "errorDetails": "Load or create a board first"
                 }
 
+            # A background save may still be writing this board; let it finish
+            # before the board is read or renamed
+            wait_for_pending_saves()
+            # The edits a failed background save was writing are still unsaved
+            if _take_save_failure(self._board):
+                self._dirty = True
+
             filename = params.get("filename")
+
+            # A board unchanged since it was opened, created or last saved
+            # already matches its file; a deferred open is never even loaded
+            if not filename and self._tracked and not self._dirty:
+                board_path = self.board.GetFileName()
+                if os.path.exists(board_path):
+                    return {
+                        "success": True,
+                        "message": f"No changes to save: {board_path}",
+                        "project": {
+                            "name": os.path.splitext(os.path.basename(board_path))[0],
+                            "path": board_path
+                        }
+                    }
+
+            # Saving needs the real board, so a deferred open is completed here
+            self.load_board()
+
             if filename:
                 # Save to new location
-                filename = os.path.abspath(os.path.expanduser(filename))
+                filename = os.path.abspath(_expand(filename))
                 self.board.SetFileName(filename)
 
-            # Save the board
-            pcbnew.SaveBoard(self.board.GetFileName(), self.board)
+            board_path = self.board.GetFileName()
+            project = {
+                "name": os.path.splitext(os.path.basename(board_path))[0],
+                "path": board_path
+            }
+
+            if params.get("background", False):
+                # Return straight away; the interface waits for the write
+                # before running the next command
+                # Marked clean now; a failed write marks it dirty again on
+                # the next save
+                _queue_save(board_path, self.board)
+                self._dirty = False
+                return {
+                    "success": True,
+                    "pending": True,
+                    "message": f"Saving project to: {board_path}",
+                    "project": project
+                }
+
+            # Save the board; it now matches the file again, so cache it under
+            # the file's new key
+            _save_board_file(board_path, self.board)
+            _cache_board(board_path, self.board)
+            self._dirty = False
 
             return {
                 "success": True,
-                "message": f"Saved project to: {self.board.GetFileName()}",
-                "project": {
-                    "name": os.path.splitext(os.path.basename(self.board.GetFileName()))[0],
-                    "path": self.board.GetFileName()
-                }
+                "message": f"Saved project to: {board_path}",
+                "project": project
             }
 
         except Exception as e:
-            logger.error(f"Error saving project: {str(e)}")
-            return {
-                "success": False,
-                "message": "Failed to save project",
-                "errorDetails": str(e)
-            }
+            logger.error("Error saving project: %s", e)
+            return _err("Failed to save project", e)
 
     def get_project_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get information about the current project"""
@@ -172,29 +566,38 @@ class ProjectCommands:
                     "errorDetails": "Load or create a board first"
                 }
 
-            title_block = self.board.GetTitleBlock()
             filename = self.board.GetFileName()
-            
+            name = os.path.splitext(os.path.basename(filename))[0]
+
+            # A board that has not been loaded yet answers from its file header
+            if isinstance(self.board, _LazyBoard) and not self.board.loaded:
+                title_info = _read_titleblock_fast(filename)
+                if title_info is not None:
+                    return {
+                        "success": True,
+                        "project": {
+                            "name": name,
+                            "path": filename,
+                            **title_info
+                        }
+                    }
+
+            title_block = self.board.GetTitleBlock()
+            get_comment = title_block.GetComment
+
             return {
                 "success": True,
                 "project": {
-                    "name": os.path.splitext(os.path.basename(filename))[0],
+                    "name": name,
                     "path": filename,
                     "title": title_block.GetTitle(),
                     "date": title_block.GetDate(),
                     "revision": title_block.GetRevision(),
                     "company": title_block.GetCompany(),
-                    "comment1": title_block.GetComment(0),
-                    "comment2": title_block.GetComment(1),
-                    "comment3": title_block.GetComment(2),
-                    "comment4": title_block.GetComment(3)
+                    **{key: get_comment(i) for i, key in enumerate(_COMMENT_KEYS)}
                 }
             }
 
         except Exception as e:
-            logger.error(f"Error getting project info: {str(e)}")
-            return {
-                "success": False,
-                "message": "Failed to get project information",
-                "errorDetails": str(e)
-            }
+            logger.error("Error getting project info: %s", e)
+            return _err("Failed to get project information", e)
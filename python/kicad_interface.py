@@ -9,6 +9,7 @@ JSON and returns responses via stdout also as JSON.
 
 import sys
 import json
+import signal
 import traceback
 import logging
 import os
@@ -74,7 +75,7 @@ except Exception as e:
 # Import command handlers
 try:
     logger.info("Importing command handlers...")
-    from commands.project import ProjectCommands
+    from commands.project import ProjectCommands, wait_for_pending_saves
     from commands.board import BoardCommands
     from commands.component import ComponentCommands
     from commands.routing import RoutingCommands
@@ -95,6 +96,50 @@ except ImportError as e:
     print(json.dumps(error_response))
     sys.exit(1)
 
+# Commands that never modify the loaded board. Any other successful command
+# invalidates state derived from the board, such as cached 2D views.
+READ_ONLY_COMMANDS = frozenset([
+    "get_project_info",
+    "get_board_info",
+    "get_layer_list",
+    "get_board_2d_view",
+    "get_board_2d_views",
+    "get_component_properties",
+    "get_component_list",
+    "get_nets_list",
+    "get_design_rules",
+    "get_drc_violations",
+    "export_gerber",
+    "export_pdf",
+    "export_svg",
+    "export_3d",
+    "export_bom",
+    "create_schematic",
+    "load_schematic",
+    "add_schematic_component",
+    "add_schematic_components",
+    "add_schematic_wire",
+    "list_schematic_libraries",
+    "export_schematic_pdf"
+])
+
+# Commands that work from the project's board without it being loaded first
+DEFERRED_BOARD_COMMANDS = frozenset([
+    "create_project",
+    "create_projects",
+    "open_project",
+    "save_project",
+    "get_project_info"
+])
+
+# Commands that load or write the board file without editing its contents
+BOARD_FILE_COMMANDS = frozenset([
+    "create_project",
+    "create_projects",
+    "open_project",
+    "save_project"
+])
+
 class KiCADInterface:
     """Main interface class to handle KiCAD operations"""
     
@@ -102,6 +147,8 @@ class KiCADInterface:
         """Initialize the interface and command handlers"""
         self.board = None
         self.project_filename = None
+        # Set when open_project deferred loading the board until first use
+        self._board_pending = False
         
         logger.info("Initializing command handlers...")
         
@@ -120,6 +167,7 @@ class KiCADInterface:
         self.command_routes = {
             # Project commands
             "create_project": self.project_commands.create_project,
+            "create_projects": self.project_commands.create_projects,
             "open_project": self.project_commands.open_project,
             "save_project": self.project_commands.save_project,
             "get_project_info": self.project_commands.get_project_info,
@@ -131,6 +179,7 @@ class KiCADInterface:
             "get_board_info": self.board_commands.get_board_info,
             "get_layer_list": self.board_commands.get_layer_list,
             "get_board_2d_view": self.board_commands.get_board_2d_view,
+            "get_board_2d_views": self.board_commands.get_board_2d_views,
             "add_board_outline": self.board_commands.add_board_outline,
             "add_mounting_hole": self.board_commands.add_mounting_hole,
             "add_text": self.board_commands.add_text,
@@ -174,6 +223,7 @@ class KiCADInterface:
             "create_schematic": self._handle_create_schematic,
             "load_schematic": self._handle_load_schematic,
             "add_schematic_component": self._handle_add_schematic_component,
+            "add_schematic_components": self._handle_add_schematic_components,
             "add_schematic_wire": self._handle_add_schematic_wire,
             "list_schematic_libraries": self._handle_list_schematic_libraries,
             "export_schematic_pdf": self._handle_export_schematic_pdf
@@ -191,16 +241,41 @@ class KiCADInterface:
             handler = self.command_routes.get(command)
             
             if handler:
-                # Execute the command
-                result = handler(params)
+                # Background saves read the board, so let them finish before
+                # anything else can use it
+                wait_for_pending_saves()
+
+                # Load a deferred board before any command that needs it
+                if self._board_pending and command not in DEFERRED_BOARD_COMMANDS:
+                    self.board = self.project_commands.load_board()
+                    self._board_pending = False
+                    self._update_command_handlers()
+
+                # Execute the command; one that fails part way may still have
+                # edited the board, so it no longer matches its file either way
+                try:
+                    result = handler(params)
+                finally:
+                    if command not in READ_ONLY_COMMANDS:
+                        self.board_commands.invalidate_view_cache()
+                        self.export_commands.invalidate_layer_cache()
+                        if command not in BOARD_FILE_COMMANDS:
+                            self.project_commands.mark_board_modified()
                 logger.debug(f"Command result: {result}")
                 
                 # Update board reference if command was successful
                 if result.get("success", False):
-                    if command == "create_project" or command == "open_project":
+                    if command in ("create_project", "create_projects", "open_project"):
                         logger.info("Updating board reference...")
-                        self.board = pcbnew.GetBoard()
-                        self._update_command_handlers()
+                        editor_board = pcbnew.GetBoard()
+                        if editor_board is not None:
+                            self.board = editor_board
+                            self._board_pending = False
+                            self._update_command_handlers()
+                        else:
+                            # Without a running editor the project's own board is
+                            # used, handed to the other handlers once one needs it
+                            self._board_pending = True
                 
                 return result
             else:
@@ -301,6 +376,32 @@ class KiCADInterface:
             logger.error(f"Error adding component to schematic: {str(e)}")
             return {"success": False, "message": str(e)}
     
+    def _handle_add_schematic_components(self, params):
+        """Add several components to a schematic with a single load and save"""
+        logger.info("Adding components to schematic")
+        try:
+            schematic_path = params.get("schematicPath")
+            components = params.get("components", [])
+            
+            if not schematic_path:
+                return {"success": False, "message": "Schematic path is required"}
+            if not components:
+                return {"success": False, "message": "Component definitions are required"}
+            
+            schematic = SchematicManager.load_schematic(schematic_path)
+            if not schematic:
+                return {"success": False, "message": "Failed to load schematic"}
+            
+            symbols = ComponentManager.add_components(schematic, components)
+            if symbols is None:
+                return {"success": False, "message": "Failed to add components"}
+            
+            SchematicManager.save_schematic(schematic, schematic_path)
+            return {"success": True, "count": len(symbols)}
+        except Exception as e:
+            logger.error(f"Error adding components to schematic: {str(e)}")
+            return {"success": False, "message": str(e)}
+    
     def _handle_add_schematic_wire(self, params):
         """Add a wire to a schematic"""
         logger.info("Adding wire to schematic")
@@ -369,10 +470,19 @@ class KiCADInterface:
             logger.error(f"Error exporting schematic to PDF: {str(e)}")
             return {"success": False, "message": str(e)}
 
+def _handle_sigterm(signum, frame):
+    """Finish queued background saves before exiting on SIGTERM"""
+    logger.info("Received SIGTERM, waiting for pending saves")
+    wait_for_pending_saves()
+    sys.exit(0)
+
 def main():
     """Main entry point"""
     logger.info("Starting KiCAD interface...")
     interface = KiCADInterface()
+
+    # The server stops this process with SIGTERM, which skips atexit handlers
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     
     try:
         logger.info("Processing commands from stdin...")
@@ -410,6 +520,10 @@ def main():
                 }
                 print(json.dumps(response))
                 sys.stdout.flush()
+
+        # Input closed: the server is gone, but queued saves still get written
+        logger.info("Input closed, waiting for pending saves")
+        wait_for_pending_saves()
                 
     except KeyboardInterrupt:
         logger.info("KiCAD interface stopped")
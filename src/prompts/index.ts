@@ -1,9 +1,9 @@
-/**
- * Prompts index for KiCAD MCP server
- * 
- * Exports all prompt registration functions
- */
-
-export { registerComponentPrompts } from './component.js';
-export { registerRoutingPrompts } from './routing.js';
-export { registerDesignPrompts } from './design.js';
+/**
+ * Prompts index for KiCAD MCP server
+ * 
+ * Exports all prompt registration functions
+ */
+
+export { registerComponentPrompts } from './component.js';
+export { registerRoutingPrompts } from './routing.js';
+export { registerDesignPrompts } from './design.js';
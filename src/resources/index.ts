@@ -1,10 +1,10 @@
-/**
- * Resources index for KiCAD MCP server
- * 
- * Exports all resource registration functions
- */
-
-export { registerProjectResources } from './project.js';
-export { registerBoardResources } from './board.js';
-export { registerComponentResources } from './component.js';
-export { registerLibraryResources } from './library.js';
+/**
+ * Resources index for KiCAD MCP server
+ * 
+ * Exports all resource registration functions
+ */
+
+export { registerProjectResources } from './project.js';
+export { registerBoardResources } from './board.js';
+export { registerComponentResources } from './component.js';
+export { registerLibraryResources } from './library.js';
@@ -15,6 +15,7 @@ import { registerComponentTools } from './tools/component.js';
 import { registerRoutingTools } from './tools/routing.js';
 import { registerDesignRuleTools } from './tools/design-rules.js';
 import { registerExportTools } from './tools/export.js';
+import { registerSchematicCommandTools } from './tools/schematic.js';
 
 // Import resource registration functions
 import { registerProjectResources } from './resources/project.js';
@@ -84,6 +85,7 @@ export class KiCADMcpServer {
     registerRoutingTools(this.server, this.callKicadScript.bind(this));
     registerDesignRuleTools(this.server, this.callKicadScript.bind(this));
     registerExportTools(this.server, this.callKicadScript.bind(this));
+    registerSchematicCommandTools(this.server, this.callKicadScript.bind(this));
     
     // Register all resources
     registerProjectResources(this.server, this.callKicadScript.bind(this));
@@ -321,15 +321,26 @@ export function registerBoardTools(server: McpServer, callKicadScript: CommandFu
       layers: z.array(z.string()).optional().describe("Optional array of layer names to include"),
       width: z.number().optional().describe("Optional width of the image in pixels"),
       height: z.number().optional().describe("Optional height of the image in pixels"),
-      format: z.enum(["png", "jpg", "svg"]).optional().describe("Image format")
+      format: z.enum(["png", "jpg", "svg"]).optional().describe("Image format"),
+      quality: z.enum(["full", "fast"]).optional().describe("Use 'fast' to skip reference/value text for quick previews"),
+      viewport: z.object({
+        x: z.number().describe("Left edge in mm"),
+        y: z.number().describe("Top edge in mm"),
+        width: z.number().describe("Region width in mm"),
+        height: z.number().describe("Region height in mm")
+      }).optional().describe("Optional board region to render instead of the whole page"),
+      outputPath: z.string().optional().describe("Optional file to write the image to instead of returning it inline")
     },
-    async ({ layers, width, height, format }) => {
+    async ({ layers, width, height, format, quality, viewport, outputPath }) => {
       logger.debug('Getting 2D board view');
       const result = await callKicadScript("get_board_2d_view", {
         layers,
         width,
         height,
-        format
+        format,
+        quality,
+        viewport,
+        outputPath
       });
       
       return {
@@ -341,5 +352,39 @@ export function registerBoardTools(server: McpServer, callKicadScript: CommandFu
     }
   );
 
+  // ------------------------------------------------------
+  // Get Board 2D Views Tool
+  // ------------------------------------------------------
+  server.tool(
+    "get_board_2d_views",
+    {
+      views: z.array(z.object({
+        layers: z.array(z.string()).optional().describe("Optional array of layer names to include"),
+        width: z.number().optional().describe("Optional width of the image in pixels"),
+        height: z.number().optional().describe("Optional height of the image in pixels"),
+        format: z.enum(["png", "jpg", "svg"]).optional().describe("Image format"),
+        quality: z.enum(["full", "fast"]).optional().describe("Use 'fast' to skip reference/value text for quick previews"),
+        viewport: z.object({
+          x: z.number().describe("Left edge in mm"),
+          y: z.number().describe("Top edge in mm"),
+          width: z.number().describe("Region width in mm"),
+          height: z.number().describe("Region height in mm")
+        }).optional().describe("Optional board region to render instead of the whole page"),
+        outputPath: z.string().optional().describe("Optional file to write the image to instead of returning it inline")
+      })).describe("Views to render in a single plot session")
+    },
+    async ({ views }) => {
+      logger.debug(`Getting ${views.length} 2D board views`);
+      const result = await callKicadScript("get_board_2d_views", { views });
+      
+      return {
+        content: [{
+          type: "text",
+          text: JSON.stringify(result)
+        }]
+      };
+    }
+  );
+
   logger.info('Board management tools registered');
 }
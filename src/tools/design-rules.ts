@@ -39,7 +39,8 @@ export function registerDesignRuleTools(server: McpServer, callKicadScript: Comm
       minMicroViaDrill: z.number().optional().describe("Minimum micro via drill size (mm)"),
       minHoleDiameter: z.number().optional().describe("Minimum hole diameter (mm)"),
       requireCourtyard: z.boolean().optional().describe("Whether to require courtyards for all footprints"),
-      courtyardClearance: z.number().optional().describe("Minimum clearance between courtyards (mm)")
+      courtyardClearance: z.number().optional().describe("Minimum clearance between courtyards (mm)"),
+      returnAll: z.boolean().optional().describe("Return every design rule instead of only the updated ones")
     },
     async (params) => {
       logger.debug('Setting design rules');
@@ -79,11 +80,12 @@ export function registerDesignRuleTools(server: McpServer, callKicadScript: Comm
   server.tool(
     "run_drc",
     {
-      reportPath: z.string().optional().describe("Optional path to save the DRC report")
+      reportPath: z.string().optional().describe("Optional path to save the DRC report"),
+      maxViolations: z.number().int().optional().describe("Optional maximum number of violations to return; the total is always reported")
     },
-    async ({ reportPath }) => {
+    async ({ reportPath, maxViolations }) => {
       logger.debug('Running DRC check');
-      const result = await callKicadScript("run_drc", { reportPath });
+      const result = await callKicadScript("run_drc", { reportPath, maxViolations });
       
       return {
         content: [{
@@ -242,11 +244,12 @@ export function registerDesignRuleTools(server: McpServer, callKicadScript: Comm
   server.tool(
     "get_drc_violations",
     {
-      severity: z.enum(["error", "warning", "all"]).optional().describe("Filter violations by severity")
+      severity: z.enum(["error", "warning", "all"]).optional().describe("Filter violations by severity"),
+      maxViolations: z.number().int().optional().describe("Optional maximum number of violations to return; the total is always reported")
     },
-    async ({ severity }) => {
+    async ({ severity, maxViolations }) => {
       logger.debug('Getting DRC violations');
-      const result = await callKicadScript("get_drc_violations", { severity });
+      const result = await callKicadScript("get_drc_violations", { severity, maxViolations });
       
       return {
         content: [{
@@ -1,13 +1,13 @@
-/**
- * Tools index for KiCAD MCP server
- * 
- * Exports all tool registration functions
- */
-
-export { registerProjectTools } from './project.js';
-export { registerBoardTools } from './board.js';
-export { registerComponentTools } from './component.js';
-export { registerRoutingTools } from './routing.js';
-export { registerDesignRuleTools } from './design-rules.js';
-export { registerExportTools } from './export.js';
-export { registerSchematicTools } from './schematic.js';
+/**
+ * Tools index for KiCAD MCP server
+ * 
+ * Exports all tool registration functions
+ */
+
+export { registerProjectTools } from './project.js';
+export { registerBoardTools } from './board.js';
+export { registerComponentTools } from './component.js';
+export { registerRoutingTools } from './routing.js';
+export { registerDesignRuleTools } from './design-rules.js';
+export { registerExportTools } from './export.js';
+export { registerSchematicTools, registerSchematicCommandTools } from './schematic.js';
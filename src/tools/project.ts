@@ -37,6 +37,25 @@ export function registerProjectTools(server: McpServer, callKicadScript: Command
         };
     });
     // ------------------------------------------------------
+    // Create Projects Tool
+    // ------------------------------------------------------
+    server.tool("create_projects", {
+        projects: z.array(z.object({
+            projectName: z.string().describe("Name of the project"),
+            path: z.string().describe("Directory path where the project should be created"),
+            template: z.string().optional().describe("Optional template to use for the new project")
+        })).describe("Projects to create")
+    }, async ({ projects }) => {
+        logger.debug(`Creating ${projects.length} projects`);
+        const result = await callKicadScript("create_projects", { projects });
+        return {
+            content: [{
+                    type: "text",
+                    text: JSON.stringify(result)
+                }]
+        };
+    });
+    // ------------------------------------------------------
     // Open Project Tool
     // ------------------------------------------------------
     server.tool("open_project", {
@@ -55,10 +74,11 @@ export function registerProjectTools(server: McpServer, callKicadScript: Command
     // Save Project Tool
     // ------------------------------------------------------
     server.tool("save_project", {
-        filename: z.string().optional().describe("Optional path to save the project to (if different from current)")
-    }, async ({ filename }) => {
+        filename: z.string().optional().describe("Optional path to save the project to (if different from current)"),
+        background: z.boolean().optional().describe("Return immediately and write the file in the background; the save is not complete when this returns, the next command waits for it to finish")
+    }, async ({ filename, background }) => {
         logger.debug(`Saving project${filename ? ` to ${filename}` : ''}`);
-        const result = await callKicadScript("save_project", { filename });
+        const result = await callKicadScript("save_project", { filename, background });
         return {
             content: [{
                     type: "text",
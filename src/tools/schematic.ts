@@ -6,7 +6,12 @@
  */
 
 import { spawn } from 'child_process';
+import { z } from 'zod';
 import { logger } from '../logger.js';
+import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
+
+// Command function type for KiCAD script calls
+type CommandFunction = (command: string, params: Record<string, unknown>) => Promise<any>;
 
 /**
  * Register all schematic-related tools with the provided MCP tool handler
@@ -387,3 +392,39 @@ export const registerSchematicTools = (addTool: Function, pythonPath: string, sc
         }
     });
 };
+
+/**
+ * Register schematic tools that run through the KiCAD interface script
+ *
+ * @param server MCP server instance
+ * @param callKicadScript Function to call KiCAD script commands
+ */
+export function registerSchematicCommandTools(server: McpServer, callKicadScript: CommandFunction) {
+    logger.info('Registering schematic command tools');
+    // ------------------------------------------------------
+    // Add Schematic Components Tool
+    // ------------------------------------------------------
+    server.tool("add_schematic_components", {
+        schematicPath: z.string().describe("Path to the schematic file"),
+        components: z.array(z.object({
+            type: z.string().describe("Component type (e.g., R, C, LED)"),
+            reference: z.string().describe("Reference designator (e.g., R1, C2)"),
+            value: z.string().optional().describe("Component value (e.g., 10k, 0.1uF)"),
+            library: z.string().optional().describe("Symbol library name"),
+            x: z.number().optional().describe("X position in schematic"),
+            y: z.number().optional().describe("Y position in schematic"),
+            rotation: z.number().optional().describe("Rotation angle in degrees"),
+            properties: z.record(z.string(), z.any()).optional().describe("Additional properties")
+        })).describe("Components to add; the schematic is loaded and saved once for all of them")
+    }, async ({ schematicPath, components }) => {
+        logger.debug(`Adding ${components.length} components to schematic: ${schematicPath}`);
+        const result = await callKicadScript("add_schematic_components", { schematicPath, components });
+        return {
+            content: [{
+                    type: "text",
+                    text: JSON.stringify(result)
+                }]
+        };
+    });
+    logger.info('Schematic command tools registered');
+}
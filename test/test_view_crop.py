@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for cropping KiCAD SVG plots to a board viewport
+"""
+
+import sys
+import os
+import re
+
+# Add the parent directory to the module search path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Start of an A4 board plot as written by pcbnew's SVG plotter: the page is
+# sized in cm and the viewBox is in plotter units
+KICAD_SVG = b"""<?xml version="1.0" standalone="no"?>
+ <!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" 
+ "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd"> 
+<svg
+  xmlns:svg="http://www.w3.org/2000/svg"
+  xmlns="http://www.w3.org/2000/svg"
+  xmlns:xlink="http://www.w3.org/1999/xlink"
+  version="1.1"
+  width="29.700220cm" height="21.000720cm" viewBox="0.00000000 0.00000000 297002.200000 210007.200000">
+<title>SVG Image created as view_0.svg date 2024/05/01 10:00:00 </title>
+  <desc>Image generated by PCBNEW </desc>
+<g style="fill:#000000; fill-opacity:1.0;stroke:#000000; stroke-opacity:1.0;
+stroke-linecap:round; stroke-linejoin:round;"
+ transform="translate(0 0) scale(1 1)">
+</g>
+</svg>
+"""
+
+def main():
+    """Test _crop_svg against a KiCAD-generated SVG header"""
+    print("=== Testing SVG viewport cropping ===")
+
+    from python.commands.board.view import _crop_svg
+
+    cropped = _crop_svg(KICAD_SVG, {"x": 100, "y": 50, "width": 40, "height": 30})
+    root = re.search(rb'<svg\b[^>]*>', cropped).group(0)
+
+    # 297.0022 mm of page span 297002.2 units, i.e. 1000 units per mm
+    view_box = [float(v) for v in re.search(rb'viewBox="([^"]*)"', root).group(1).split()]
+    expected = [100000.0, 50000.0, 40000.0, 30000.0]
+    assert all(abs(a - b) < 1e-3 for a, b in zip(view_box, expected)), view_box
+    assert b' width="40mm"' in root and b' height="30mm"' in root, root
+    # Everything after the root element is left untouched
+    assert cropped.endswith(KICAD_SVG[KICAD_SVG.index(b'<title>'):])
+
+    print("Cropped viewBox:", view_box)
+    print("=== SVG viewport cropping test passed ===")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())